@@ -0,0 +1,45 @@
+"""
+Compare fn_eq_diagnostics' samples (read from silver.eq_last_samples) with the same
+"latest rows" queried straight from the silver tables, row for row.
+"""
+from sqlalchemy import text
+from config import get_engine
+
+# The original check_eq_data.py queries, with ties on utc_datetime broken as sql/006 does
+DIRECT_SQL = {
+    "rl_sample": """
+        SELECT utc_datetime, country, tag AS variant, t FROM silver.eq_residual_load t
+        ORDER BY utc_datetime DESC, COALESCE(country, ''), COALESCE(tag::text, '') LIMIT 5
+    """,
+    "cons_sample": """
+        SELECT utc_datetime, t FROM silver.eq_consumption t
+        WHERE country = 'FR' ORDER BY utc_datetime DESC LIMIT 5
+    """,
+    "ws_sample": """
+        SELECT utc_datetime, data_type AS variant, t FROM silver.eq_wind_solar t
+        WHERE country = 'FR' ORDER BY utc_datetime DESC, COALESCE(data_type::text, '') LIMIT 10
+    """,
+}
+
+engine = get_engine()
+
+with engine.connect() as conn:
+    payload = conn.execute(text("SELECT silver.fn_eq_diagnostics()")).scalar()
+    direct = {
+        key: conn.execute(text(f"SELECT COALESCE(jsonb_agg(to_jsonb(x.t)), '[]') FROM ({sql}) x")).scalar()
+        for key, sql in DIRECT_SQL.items()
+    }
+
+ok = True
+for key, expected in direct.items():
+    got = payload[key]
+    match = got == expected
+    ok &= match
+    print(f"{'✓' if match else '✗'} {key}: {len(got)} rows from eq_last_samples, {len(expected)} direct")
+    if not match:
+        for i, (g, e) in enumerate(zip(got, expected)):
+            if g != e:
+                print(f"    first difference at row {i}:\n      samples: {g}\n      direct:  {e}")
+                break
+
+print("\nAll samples match." if ok else "\nSamples differ; re-run the sql/006 backfill.")
@@ -1,15 +1,33 @@
-from sqlalchemy import create_engine, inspect
-from config import DB_CONNECTION_STRING
+from itertools import groupby
 
-engine = create_engine(DB_CONNECTION_STRING)
-inspector = inspect(engine)
+from sqlalchemy import text
+from config import get_engine
 
-for table in ['eq_consumption', 'eq_residual_load', 'eq_wind_solar']:
+engine = get_engine()
+
+TABLES = ['eq_consumption', 'eq_residual_load', 'eq_wind_solar']
+
+# One pg_catalog query for all three tables, grouped client-side
+with engine.connect() as conn:
+    rows = conn.execute(text("""
+        SELECT c.relname, a.attname, format_type(a.atttypid, a.atttypmod)
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_attribute a ON a.attrelid = c.oid
+        WHERE n.nspname = 'silver'
+          AND c.relname = ANY(:tables)
+          AND a.attnum > 0
+          AND NOT a.attisdropped
+        ORDER BY c.relname, a.attnum
+    """), {"tables": TABLES}).all()
+
+columns = {table: [(col, dtype) for _, col, dtype in grp] for table, grp in groupby(rows, key=lambda r: r[0])}
+
+for table in TABLES:
     print(f"\n{'='*60}")
     print(f"Columns in {table}:")
-    try:
-        cols = inspector.get_columns(table, schema='silver')
-        for col in cols:
-            print(f"  {col['name']}: {col['type']}")
-    except Exception as e:
-        print(f"  Error: {e}")
+    if table not in columns:
+        print("  Error: table not found in schema 'silver'")
+        continue
+    for name, dtype in columns[table]:
+        print(f"  {name}: {dtype}")
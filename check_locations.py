@@ -1,23 +1,30 @@
-from sqlalchemy import create_engine, text
-from config import DB_CONNECTION_STRING
+from sqlalchemy import text
+from config import get_engine
 
-engine = create_engine(DB_CONNECTION_STRING)
+engine = get_engine()
 
 with engine.connect() as conn:
-    # Check locations
+    # Check locations (loose index scan: one index probe per distinct value, see sql/002_*.sql)
     result = conn.execute(text("""
-        SELECT DISTINCT location
-        FROM silver.metdesk_forecasts
-        LIMIT 20
+        WITH RECURSIVE t AS (
+            SELECT MIN(location) AS location FROM silver.metdesk_forecasts
+            UNION ALL
+            SELECT (SELECT MIN(location) FROM silver.metdesk_forecasts WHERE location > t.location)
+            FROM t
+            WHERE t.location IS NOT NULL
+        )
+        SELECT location FROM t WHERE location IS NOT NULL LIMIT 20
     """))
-    locations = [row[0] for row in result]
+    locations = result.scalars().all()
     print("Available locations in metdesk_forecasts:", locations)
     
-    # Check if FR exists
+    # Check if FR exists (stops at the first matching row)
     result = conn.execute(text("""
-        SELECT COUNT(*) 
-        FROM silver.metdesk_forecasts
-        WHERE location = 'FR'
+        SELECT EXISTS (
+            SELECT 1
+            FROM silver.metdesk_forecasts
+            WHERE location = 'FR'
+        )
     """))
-    count = result.scalar()
-    print(f"Rows with location='FR': {count}")
+    exists = result.scalar()
+    print(f"Rows with location='FR': {'yes' if exists else 'none'}")
@@ -1,24 +1,39 @@
-from sqlalchemy import create_engine, inspect
-from config import DB_CONNECTION_STRING
+from sqlalchemy import text
+from config import get_engine
 
-engine = create_engine(DB_CONNECTION_STRING)
-inspector = inspect(engine)
+engine = get_engine()
 
-# Get all tables in silver schema
-tables = inspector.get_table_names(schema='silver')
-print(f"Total tables in silver: {len(tables)}")
+# Table count, EQ/forecast-related tables and metdesk_forecasts columns, all filtered in SQL
+with engine.connect() as conn:
+    total, matching, cols = conn.execute(text("""
+        SELECT
+            (SELECT COUNT(*) FROM pg_tables WHERE schemaname = 'silver'),
+            ARRAY(
+                SELECT tablename FROM pg_tables
+                WHERE schemaname = 'silver'
+                  AND tablename ~* 'eq|demand|forecast|metdesk'
+                ORDER BY 1
+            ),
+            ARRAY(
+                SELECT attname FROM pg_attribute
+                WHERE attrelid = to_regclass('silver.metdesk_forecasts')
+                  AND attnum > 0
+                  AND NOT attisdropped
+                ORDER BY attnum
+            )
+    """)).one()
 
-# Look for EQ or forecast related  
-matching = [t for t in tables if any(x in t.lower() for x in ['eq', 'demand', 'forecast', 'metdesk'])]
+print(f"Total tables in silver: {total}")
+
+# Look for EQ or forecast related
 print("\nMatching tables:")
-for table in sorted(matching):
+for table in matching:
     print(f"  {table}")
 
-# Check columns in metdesk_forecasts specifically  
+# Check columns in metdesk_forecasts specifically
 print("\n" + "="*60)
 print("Columns in metdesk_forecasts:")
-cols = inspector.get_columns('metdesk_forecasts', schema='silver')
 for col in cols:
-    print(f"  {col['name']}")
-    
+    print(f"  {col}")
+
 print("\nTotal columns:", len(cols))
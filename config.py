@@ -1,24 +1,50 @@
 """
 Configuration for French Residual Load Scenario Builder
 """
+import functools
 import os
+import sys
+import tomllib
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@functools.cache
+def _streamlit_secrets() -> dict:
+    """Streamlit secrets, parsed once; empty when none are configured.
+
+    Outside a running Streamlit app the secrets.toml files are read directly,
+    so CLI scripts don't pay for importing streamlit.
+    """
+    if "streamlit" in sys.modules:
+        try:
+            import streamlit as st
+
+            return dict(st.secrets)
+        except Exception:
+            return {}
+
+    secrets = {}
+    for path in (
+        os.path.expanduser("~/.streamlit/secrets.toml"),
+        os.path.join(os.getcwd(), ".streamlit", "secrets.toml"),
+    ):
+        try:
+            with open(path, "rb") as f:
+                secrets.update(tomllib.load(f))
+        except (OSError, tomllib.TOMLDecodeError):
+            pass
+    return secrets
+
+
+@functools.cache
 def _get_secret(key: str, default: str) -> str:
     """Read from env first, then Streamlit secrets if available."""
     if key in os.environ:
         return os.environ[key]
-    try:
-        import streamlit as st
-
-        if key in st.secrets:
-            return st.secrets[key]
-    except Exception:
-        pass
-    return default
+    return _streamlit_secrets().get(key, default)
 
 # =============================================================================
 # DATABASE (PostgreSQL - Azure)
@@ -35,6 +61,52 @@ DB_CONNECTION_STRING = (
     f"?sslmode={DB_SSLMODE}"
 )
 
+_engine = None
+
+
+def get_engine():
+    """Return the process-wide SQLAlchemy engine, creating its pool on first use."""
+    global _engine
+    if _engine is None:
+        import atexit
+
+        import psycopg2.extensions
+        from sqlalchemy import create_engine, event
+
+        _engine = create_engine(
+            DB_CONNECTION_STRING,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            connect_args={
+                # This app only reads; let the server treat every transaction as read-only
+                "options": "-c default_transaction_read_only=on",
+                "application_name": "residual_load_scenarios",
+                # TCP keepalives stop Azure's idle timeout dropping pooled TLS sessions
+                "keepalives": 1,
+                "keepalives_idle": 30,
+                "keepalives_interval": 10,
+                "keepalives_count": 5,
+            },
+        )
+
+        # Decode NUMERIC straight to float instead of Decimal, so read_sql yields float64 columns
+        dec2float = psycopg2.extensions.new_type(
+            psycopg2.extensions.DECIMAL.values,
+            "DEC2FLOAT",
+            lambda value, cur: float(value) if value is not None else None,
+        )
+
+        @event.listens_for(_engine, "connect")
+        def _register_types(dbapi_conn, connection_record):
+            psycopg2.extensions.register_type(dec2float, dbapi_conn)
+
+        # Close pooled connections cleanly when a script or the app exits
+        atexit.register(_engine.dispose)
+
+    return _engine
+
 # =============================================================================
 # VOLUE INSIGHT / WATTSIGHT (for demand forecasts)
 # =============================================================================
@@ -79,6 +151,9 @@ AVAILABLE_MODELS = {
     },
 }
 
+# Selector labels, built once per process (read-only)
+MODEL_OPTIONS = MappingProxyType({k: v["label"] for k, v in AVAILABLE_MODELS.items()})
+
 # Pre-computed percentile members available in MetDesk data
 METDESK_PERCENTILE_MEMBERS = ["0%", "10%", "25%", "40%", "60%", "75%", "90%", "100%"]
 METDESK_SPECIAL_MEMBERS = ["control", "mean", "median"]
@@ -88,6 +163,10 @@ METDESK_SPECIAL_MEMBERS = ["control", "mean", "median"]
 # =============================================================================
 FORECAST_HORIZON_DAYS = 14
 
+# Ensemble percentile levels computed for residual load (P0, P5, ..., P100)
+PERCENTILE_LEVELS = tuple(range(0, 101, 5))
+PERCENTILE_LABELS = MappingProxyType({p: f"P{p}" for p in PERCENTILE_LEVELS})
+
 # Percentiles for residual load scenarios (crossed)
 PERCENTILES_FOR_CROSSING = {
     "P90_RL": {"demand": "90%", "renewables": "10%"},   # High residual load
@@ -97,11 +176,22 @@ PERCENTILES_FOR_CROSSING = {
     "P10_RL": {"demand": "10%", "renewables": "90%"},   # Low residual load
 }
 
+# Same table, column-aligned: with demand/renewable percentile matrices of shape (T, 5)
+# ordered as CROSSING_LEVELS, all scenarios are one fancy-indexed subtraction:
+#   demand[:, SCENARIO_DEMAND_COLS] - renewables[:, SCENARIO_RENEWABLES_COLS]  -> (T, 5)
+CROSSING_LEVELS = ["10%", "25%", "median", "75%", "90%"]
+CROSSING_PERCENTILES = [10, 25, 50, 75, 90]  # CROSSING_LEVELS as percentile numbers
+SCENARIO_LABELS = list(PERCENTILES_FOR_CROSSING)
+SCENARIO_DEMAND_COLS = [CROSSING_LEVELS.index(v["demand"]) for v in PERCENTILES_FOR_CROSSING.values()]
+SCENARIO_RENEWABLES_COLS = [CROSSING_LEVELS.index(v["renewables"]) for v in PERCENTILES_FOR_CROSSING.values()]
+
 # =============================================================================
 # SCHEDULING
 # =============================================================================
 REFORECAST_TIMES_UTC = ["06:00", "12:00", "18:00"]
-REFRESH_INTERVAL_MINUTES = 60
+REFRESH_INTERVAL_MINUTES = 60  # max-staleness fallback; loads are signalled via NOTIFY
+UPDATE_NOTIFY_CHANNEL = "silver_eq_updates"
+UPDATE_NOTIFY_DEBOUNCE_S = 30  # notifications within this window of the first one share one update
 
 # =============================================================================
 # OUTPUT
@@ -8,12 +8,19 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
+import threading
+import time
+import weakref
 
-from engine import ResidualLoadEngine
+from engine import ResidualLoadEngine, ensemble_percentiles, member_column_groups
 from scheduler import ReforecastScheduler
-from config import AVAILABLE_MODELS
+from metdesk_db import clear_issue_cache
+from config import AVAILABLE_MODELS, MODEL_OPTIONS, PERCENTILE_LEVELS, PERCENTILE_LABELS
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,13 +41,169 @@ st.set_page_config(
 if "engine" not in st.session_state:
     st.session_state.engine = ResidualLoadEngine()
 
-if "scheduler" not in st.session_state:
-    st.session_state.scheduler = ReforecastScheduler(
-        update_callback=st.session_state.engine.update
-    )
+
+@st.cache_resource
+def shared_scheduler() -> tuple:
+    """One scheduler (and one NOTIFY listener) per process, refreshing every subscribed session's engine.
+
+    Returns (scheduler, engines, lock); sessions add/discard their engine under the lock,
+    and engines of closed sessions drop out of the weak set on their own.
+    """
+    engines: "weakref.WeakSet[ResidualLoadEngine]" = weakref.WeakSet()
+    lock = threading.Lock()
+
+    def update_all():
+        with lock:
+            subscribed = list(engines)
+        for eng in subscribed:
+            try:
+                eng.update()
+            except Exception:
+                logger.exception("Auto-refresh update failed")
+
+    return ReforecastScheduler(update_callback=update_all), engines, lock
+
 
 engine: ResidualLoadEngine = st.session_state.engine
-scheduler: ReforecastScheduler = st.session_state.scheduler
+scheduler, auto_refresh_engines, auto_refresh_lock = shared_scheduler()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def available_issues_by_model(_engine: ResidualLoadEngine, location: str) -> dict:
+    """Issue times for every model at `location` from one query, cached so reruns and model switches don't re-query."""
+    return _engine.get_available_issues_by_model(location=location)
+
+
+def list_available_issues(_engine: ResidualLoadEngine, model: str, location: str) -> list:
+    """Issue times for (model, location)."""
+    return available_issues_by_model(_engine, location).get(model, [])
+
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def residual_load_delta(_engine: ResidualLoadEngine, model: str, issue_new, issue_old, location: str, hour_start: int) -> pd.DataFrame:
+    """Residual delta over the 14 days from `hour_start` (epoch seconds, UTC); the hour is part of the cache key."""
+    valid_start = pd.Timestamp(hour_start, unit="s", tz="UTC")
+    return _engine.compute_residual_load_delta(
+        model=model,
+        issue_new=issue_new,
+        issue_old=issue_old,
+        valid_start=valid_start,
+        valid_end=valid_start + pd.Timedelta(days=14),
+        location=location,
+    )
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV export via Arrow's C++ writer, cached so tab switches don't re-serialise."""
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    return buf.getvalue().to_pybytes()
+
+
+@st.cache_resource
+def prefetch_executor() -> ThreadPoolExecutor:
+    """Background workers shared by all sessions for prefetching Refresh inputs."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+
+PREFETCH_MAX_AGE_S = 300
+
+
+@st.cache_data(show_spinner=False)
+def compute_ensemble_percentiles(renewables: pd.DataFrame, groups: tuple, qs: tuple) -> list:
+    """Row-wise percentiles for each group of member columns, every q from one sort.
+
+    Returns one {q: array} per group ({} for an empty group). Groups with the same member
+    count are stacked into a single (group, time, member) array and sorted in one call.
+    """
+    # float32 halves the bytes sorted; C order keeps each timestep's members contiguous
+    blocks = [
+        np.ascontiguousarray(renewables[list(cols)].to_numpy(dtype=np.float32)) if cols else None
+        for cols in groups
+    ]
+    present = [b for b in blocks if b is not None]
+    if present and len({b.shape for b in present}) == 1:
+        stacked = iter(ensemble_percentiles(np.stack(present), qs).swapaxes(0, 1))
+        results = [next(stacked) if b is not None else None for b in blocks]
+    else:
+        results = [ensemble_percentiles(b, qs) if b is not None else None for b in blocks]
+    return [dict(zip(qs, r)) if r is not None else {} for r in results]
+
+
+MAX_TRACE_POINTS = 2000
+
+# Colour palette for the residual percentile lines
+PERCENTILE_COLORS = {
+    0: "#ff0000", 5: "#ff3333", 10: "#ff6666", 15: "#ff9999", 20: "#ffcccc",
+    25: "#0066ff", 30: "#3d7fb8", 35: "#2d5a8c", 40: "#1d3a60", 45: "#0d1a34",
+    50: "#1f77b4", 55: "#6daed5", 60: "#9bc4db", 65: "#b5d4e5", 70: "#cfe5f0",
+    75: "#00aa00", 80: "#33cc33", 85: "#66ff66", 90: "#99ff99", 95: "#ccffcc",
+    100: "#00ff00"
+}
+PERCENTILE_TRACE_NAMES = frozenset(PERCENTILE_LABELS.values())
+
+
+def _downsample(x, y, max_points: int = MAX_TRACE_POINTS):
+    """Min/max per bucket so long series keep their envelope with at most ~max_points vertices."""
+    y = np.asarray(y)
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    width = -(-n // (max_points // 2))  # ceil: two points (min, max) per bucket
+    full = n // width * width
+    buckets = y[:full].reshape(-1, width)
+    offsets = np.arange(0, full, width)
+    lo = offsets + np.argmin(np.nan_to_num(buckets, nan=np.inf), axis=1)
+    hi = offsets + np.argmax(np.nan_to_num(buckets, nan=-np.inf), axis=1)
+    idx = np.unique(np.concatenate([lo, hi, [n - 1]]))  # keep the last point for the x range
+    return np.asarray(x)[idx], y[idx]
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def residual_base_figure(residual: pd.DataFrame) -> go.Figure:
+    """Every percentile line (hidden, legend-only) plus the mean; callers toggle visibility per selection."""
+    fig = go.Figure()
+    for pct in PERCENTILE_LEVELS:
+        col_name = f"ens_P{pct}"
+        if col_name in residual.columns:
+            is_bold = pct in [10, 25, 50, 75, 90]  # Highlight common percentiles
+            x, y = _downsample(residual["utc_datetime"], residual[col_name])
+            fig.add_trace(go.Scattergl(
+                x=x,
+                y=y,
+                mode="lines",
+                name=PERCENTILE_LABELS[pct],
+                line=dict(color=PERCENTILE_COLORS.get(pct, "#000000"), width=2.5 if is_bold else 1.5),
+                opacity=1.0 if is_bold else 0.7,
+                hoverinfo=None if is_bold else "skip",  # unified hover only on the headline lines
+                visible="legendonly",
+            ))
+
+    # Mean line
+    if "ens_mean" in residual.columns:
+        x, y = _downsample(residual["utc_datetime"], residual["ens_mean"])
+        fig.add_trace(go.Scattergl(
+            x=x, y=y,
+            mode="lines", name="Mean",
+            line=dict(color="#ff7f0e", width=3, dash="dash"),
+        ))
+    return fig
+
+
+def _ts_key(times: pd.Series) -> np.ndarray:
+    """utc_datetime as int64 nanoseconds, for hashing/aligning on plain integers."""
+    return times.dt.as_unit("ns").astype("int64").to_numpy()
+
+
+def _prefetch_inputs():
+    """On model/country change, start fetching the latest-issue inputs while the user is still choosing."""
+    model = st.session_state.model_select
+    countries = tuple(st.session_state.get("country_select") or ["fr"])
+    clear_issue_cache()  # resolve "Latest" against the DB, not an earlier lookup
+    future = prefetch_executor().submit(engine.fetch_inputs, model, None, list(countries))
+    st.session_state._prefetch = ((model, None, countries), time.monotonic(), future)
+
 
 # =============================================================================
 # SIDEBAR
@@ -51,12 +214,13 @@ with st.sidebar:
 
     # ----- MODEL SELECTOR -----
     st.subheader("🌤️ NWP Model")
-    model_options = {k: v["label"] for k, v in AVAILABLE_MODELS.items()}
     selected_model = st.selectbox(
         "Select forecast model",
-        options=list(model_options.keys()),
-        format_func=lambda x: model_options[x],
+        options=list(MODEL_OPTIONS),
+        format_func=MODEL_OPTIONS.__getitem__,
         index=0,
+        key="model_select",
+        on_change=_prefetch_inputs,
     )
 
     # Show model info
@@ -78,12 +242,14 @@ with st.sidebar:
         options=list(country_options.keys()),
         format_func=lambda x: country_options[x],
         default=["fr"],
+        key="country_select",
+        on_change=_prefetch_inputs,
     )
 
     try:
         # use first selected country (if any) to list available issues
         issue_location = selected_countries[0] if selected_countries else None
-        available_issues = engine.get_available_issues(selected_model, location=issue_location)
+        available_issues = list_available_issues(engine, selected_model, issue_location)
         if available_issues:
             issue_options = ["Latest"] + [
                 dt.strftime("%Y-%m-%d %H:%M UTC") if hasattr(dt, 'strftime') else str(dt)
@@ -110,8 +276,23 @@ with st.sidebar:
     if st.button("🔄 Refresh Data", use_container_width=True, type="primary"):
         with st.spinner(f"Fetching {model_info['label']} data..."):
             try:
+                if selected_issue is None:
+                    clear_issue_cache()  # pick up a run that landed since the last lookup
+                # use prefetched inputs if they match the current selection and are still fresh
+                inputs = None
+                prefetched = st.session_state.get("_prefetch")
+                if prefetched:
+                    key, started, future = prefetched
+                    fresh = time.monotonic() - started < PREFETCH_MAX_AGE_S
+                    if fresh and key == (selected_model, selected_issue, tuple(selected_countries or ["fr"])):
+                        del st.session_state["_prefetch"]
+                        try:
+                            inputs = future.result() or None  # empty prefetch: fetch again
+                        except Exception:
+                            logger.warning("Prefetch failed; fetching inputs again", exc_info=True)
+                            inputs = None
                 # pass selected countries to engine (list of codes)
-                engine.update(model=selected_model, issue=selected_issue, countries=selected_countries)
+                engine.update(model=selected_model, issue=selected_issue, countries=selected_countries, inputs=inputs)
                 st.success("Updated!")
             except Exception as e:
                 st.error(f"Update failed: {e}")
@@ -119,14 +300,15 @@ with st.sidebar:
 
     # Auto-refresh toggle
     auto_refresh = st.toggle("Auto-refresh (hourly)", value=False)
-    if auto_refresh:
-        if not hasattr(st.session_state, "_scheduler_running") or not st.session_state._scheduler_running:
+    # the scheduler is shared: it runs while at least one session has auto-refresh on
+    with auto_refresh_lock:
+        if auto_refresh:
+            auto_refresh_engines.add(engine)
             scheduler.start()
-            st.session_state._scheduler_running = True
-    else:
-        if hasattr(st.session_state, "_scheduler_running") and st.session_state._scheduler_running:
-            scheduler.stop()
-            st.session_state._scheduler_running = False
+        elif engine in auto_refresh_engines:
+            auto_refresh_engines.discard(engine)
+            if not auto_refresh_engines:
+                scheduler.stop()
 
     st.markdown("---")
 
@@ -137,19 +319,18 @@ with st.sidebar:
     
     # Percentile selector
     st.subheader("Percentile Bands")
-    available_percentiles = [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90, 95, 100]
     default_percentiles = [10, 25, 50, 75, 90]
     selected_percentiles = st.multiselect(
         "Show percentile lines (P0-P100)",
-        options=available_percentiles,
+        options=PERCENTILE_LEVELS,
         default=default_percentiles,
-        format_func=lambda x: f"P{x}"
+        format_func=PERCENTILE_LABELS.__getitem__,
     )
 
     # Separate percentile selectors for Wind and Solar (single-select)
     st.subheader("Wind / Solar Percentiles (for combined residual)")
-    wind_pct = st.selectbox("Wind percentile", options=available_percentiles, index=available_percentiles.index(50), format_func=lambda x: f"P{x}")
-    solar_pct = st.selectbox("Solar percentile", options=available_percentiles, index=available_percentiles.index(50), format_func=lambda x: f"P{x}")
+    wind_pct = st.selectbox("Wind percentile", options=PERCENTILE_LEVELS, index=PERCENTILE_LEVELS.index(50), format_func=PERCENTILE_LABELS.__getitem__)
+    solar_pct = st.selectbox("Solar percentile", options=PERCENTILE_LEVELS, index=PERCENTILE_LEVELS.index(50), format_func=PERCENTILE_LABELS.__getitem__)
 
     st.markdown("---")
 
@@ -160,7 +341,7 @@ with st.sidebar:
     if enable_comparison:
         # Fetch available issues for comparison
         try:
-            historical_issues = engine.get_available_issues(selected_model, location=issue_location)
+            historical_issues = list_available_issues(engine, selected_model, issue_location)
             if len(historical_issues) > 1:
                 # Issue selector for comparison (pick an old one)
                 issue_options_comp = [
@@ -228,6 +409,14 @@ if not scenarios or not any(
     st.info("👈 Select a model and click **Refresh Data** in the sidebar.")
     st.stop()
 
+# Member column groups and wind/solar percentiles for every level, shared by the residual and renewables tabs
+renewables_ens = scenarios.get("renewables_ens", pd.DataFrame())
+# attrs don't survive every pandas operation, so fall back to classifying the columns by name
+col_groups = renewables_ens.attrs.get("col_groups") or member_column_groups(tuple(renewables_ens.columns))
+wind_percentiles, solar_percentiles = compute_ensemble_percentiles(
+    renewables_ens, (col_groups["wind"], col_groups["solar"]), PERCENTILE_LEVELS
+)
+
 
 # =============================================================================
 # TABS
@@ -241,70 +430,37 @@ with tab_residual:
     residual = scenarios.get("residual_scenarios", pd.DataFrame())
 
     if not residual.empty:
-        fig = go.Figure()
-
-        # Define color palette for percentile lines
-        colors = {
-            0: "#ff0000", 5: "#ff3333", 10: "#ff6666", 15: "#ff9999", 20: "#ffcccc",
-            25: "#0066ff", 30: "#3d7fb8", 35: "#2d5a8c", 40: "#1d3a60", 45: "#0d1a34",
-            50: "#1f77b4", 55: "#6daed5", 60: "#9bc4db", 65: "#b5d4e5", 70: "#cfe5f0",
-            75: "#00aa00", 80: "#33cc33", 85: "#66ff66", 90: "#99ff99", 95: "#ccffcc",
-            100: "#00ff00"
-        }
-        
-        # Add selected percentile lines
-        for pct in sorted(selected_percentiles):
-            col_name = f"ens_P{pct}"
-            if col_name in residual.columns:
-                is_bold = pct in [10, 25, 50, 75, 90]  # Highlight common percentiles
-                fig.add_trace(go.Scatter(
-                    x=residual["utc_datetime"],
-                    y=residual[col_name],
-                    mode="lines",
-                    name=f"P{pct}",
-                    line=dict(color=colors.get(pct, "#000000"), width=2.5 if is_bold else 1.5),
-                    opacity=1.0 if is_bold else 0.7,
-                ))
-
-        # Mean line
-        if "ens_mean" in residual.columns:
-            fig.add_trace(go.Scatter(
-                x=residual["utc_datetime"], y=residual["ens_mean"],
-                mode="lines", name="Mean",
-                line=dict(color="#ff7f0e", width=3, dash="dash"),
-            ))
+        # All percentile lines are in the cached base figure; the selection only flips visibility
+        fig = residual_base_figure(residual)
+        shown = {PERCENTILE_LABELS[pct] for pct in selected_percentiles}
+        fig.for_each_trace(
+            lambda t: t.update(visible=True if t.name in shown else "legendonly"),
+            selector=lambda t: t.name in PERCENTILE_TRACE_NAMES,
+        )
 
         # Percentile-based residual using selected wind/solar percentiles
         renewables = scenarios.get("renewables_ens", pd.DataFrame())
         consumption = scenarios.get("consumption", pd.DataFrame())
         try:
             if (not renewables.empty) and (not consumption.empty):
-                # identify member columns for wind/solar
-                wind_cols = [c for c in renewables.columns if c.startswith("wind_ens_")]
-                solar_cols = [c for c in renewables.columns if c.startswith("solar_ens_")]
-
-                if wind_cols and solar_cols:
-                    # compute selected percentiles from ensemble members
-                    wind_vals = renewables[wind_cols].values
-                    solar_vals = renewables[solar_cols].values
-
-                    wind_pct_series = np.nanpercentile(wind_vals, wind_pct, axis=1)
-                    solar_pct_series = np.nanpercentile(solar_vals, solar_pct, axis=1)
-
-                    pct_df = pd.DataFrame({
-                        "utc_datetime": renewables["utc_datetime"],
-                        f"wind_P{wind_pct}": wind_pct_series,
-                        f"solar_P{solar_pct}": solar_pct_series,
-                    })
-
-                    merged_pct = consumption.merge(pct_df, on="utc_datetime", how="inner")
-                    if not merged_pct.empty:
-                        merged_pct["residual_pct"] = merged_pct["consumption_mw"] - (
-                            merged_pct[f"wind_P{wind_pct}"] + merged_pct[f"solar_P{solar_pct}"]
-                        )
-                        fig.add_trace(go.Scatter(
-                            x=merged_pct["utc_datetime"],
-                            y=merged_pct["residual_pct"],
+                if wind_percentiles and solar_percentiles:
+                    wind_pct_series = wind_percentiles[wind_pct]
+                    solar_pct_series = solar_percentiles[solar_pct]
+
+                    # Inner-join on the shared hourly grid: positional lookup on int64 keys
+                    pos = pd.Index(_ts_key(renewables["utc_datetime"])).get_indexer(
+                        _ts_key(consumption["utc_datetime"])
+                    )
+                    hit = pos >= 0
+                    if hit.any():
+                        # residual = consumption - wind - solar, in place on one float64 buffer
+                        residual_pct = consumption["consumption_mw"].to_numpy(dtype=np.float64)[hit]
+                        np.subtract(residual_pct, wind_pct_series[pos[hit]], out=residual_pct)
+                        np.subtract(residual_pct, solar_pct_series[pos[hit]], out=residual_pct)
+                        x, y = _downsample(consumption["utc_datetime"].to_numpy()[hit], residual_pct)
+                        fig.add_trace(go.Scattergl(
+                            x=x,
+                            y=y,
                             mode="lines",
                             name=f"Residual (Wind P{wind_pct} + Solar P{solar_pct})",
                             line=dict(color="#800080", width=3, dash="dot"),
@@ -321,6 +477,7 @@ with tab_residual:
             height=chart_height,
             hovermode="x unified",
             legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0, xanchor="left",),
+            uirevision="static",
         )
         fig.add_hline(y=0, line_dash="dot", line_color="gray", opacity=0.5)
         st.plotly_chart(fig, use_container_width=True)
@@ -366,22 +523,30 @@ with tab_renewables:
     if not renewables.empty:
         fig = go.Figure()
 
-        ens_cols = [c for c in renewables.columns if c.startswith("total_ren_ens_")]
+        ens_cols = list(col_groups["total"])
 
-        # Individual members (spaghetti)
+        # Individual members (spaghetti), one trace with a NaN gap between members
         if show_individual_members and ens_cols:
-            for col in ens_cols:
-                fig.add_trace(go.Scatter(
-                    x=renewables["utc_datetime"], y=renewables[col],
-                    mode="lines",
-                    line=dict(color="rgba(100,200,100,0.2)", width=0.8),
-                    showlegend=False, hoverinfo="skip",
-                ))
+            members = renewables[ens_cols].to_numpy(dtype=np.float32).T
+            times = renewables["utc_datetime"].to_numpy()
+            if len(times) > MAX_TRACE_POINTS:
+                # same strided time axis for every member so the x array can be tiled
+                keep = np.linspace(0, len(times) - 1, MAX_TRACE_POINTS).astype(np.int64)
+                members, times = members[:, keep], times[keep]
+            ys = np.column_stack([members, np.full(len(ens_cols), np.nan)]).ravel()
+            xs = np.tile(np.append(times, None), len(ens_cols))
+            fig.add_trace(go.Scattergl(
+                x=xs, y=ys,
+                mode="lines",
+                line=dict(color="rgba(100,200,100,0.2)", width=0.8),
+                showlegend=False, hoverinfo="skip",
+            ))
 
         # Ensemble statistics
         if "ens_mean" in renewables.columns:
-            fig.add_trace(go.Scatter(
-                x=renewables["utc_datetime"], y=renewables["ens_mean"],
+            x, y = _downsample(renewables["utc_datetime"], renewables["ens_mean"])
+            fig.add_trace(go.Scattergl(
+                x=x, y=y,
                 mode="lines", name="Ensemble Mean",
                 line=dict(color="#2ca02c", width=2.5),
             ))
@@ -394,27 +559,24 @@ with tab_renewables:
             height=chart_height,
             hovermode="x unified",
             legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0),
+            uirevision="static",
         )
         # Add selected wind/solar percentile lines (computed from ensembles)
         try:
-            renewables = scenarios.get("renewables_ens", pd.DataFrame())
-            if not renewables.empty:
-                wind_cols = [c for c in renewables.columns if c.startswith("wind_ens_")]
-                solar_cols = [c for c in renewables.columns if c.startswith("solar_ens_")]
-                if wind_cols:
-                    wind_pct_series = np.nanpercentile(renewables[wind_cols].values, wind_pct, axis=1)
-                    fig.add_trace(go.Scatter(
-                        x=renewables["utc_datetime"], y=wind_pct_series,
-                        mode="lines", name=f"Wind P{wind_pct}",
-                        line=dict(color="#1f77b4", width=2, dash="dash"),
-                    ))
-                if solar_cols:
-                    solar_pct_series = np.nanpercentile(renewables[solar_cols].values, solar_pct, axis=1)
-                    fig.add_trace(go.Scatter(
-                        x=renewables["utc_datetime"], y=solar_pct_series,
-                        mode="lines", name=f"Solar P{solar_pct}",
-                        line=dict(color="#ff7f0e", width=2, dash="dash"),
-                    ))
+            if wind_percentiles:
+                x, y = _downsample(renewables["utc_datetime"], wind_percentiles[wind_pct])
+                fig.add_trace(go.Scattergl(
+                    x=x, y=y,
+                    mode="lines", name=f"Wind P{wind_pct}",
+                    line=dict(color="#1f77b4", width=2, dash="dash"),
+                ))
+            if solar_percentiles:
+                x, y = _downsample(renewables["utc_datetime"], solar_percentiles[solar_pct])
+                fig.add_trace(go.Scattergl(
+                    x=x, y=y,
+                    mode="lines", name=f"Solar P{solar_pct}",
+                    line=dict(color="#ff7f0e", width=2, dash="dash"),
+                ))
         except Exception:
             logger.exception("Error adding wind/solar percentile lines")
 
@@ -429,20 +591,13 @@ with tab_comparison:
         st.subheader(f"Residual Load Forecast Comparison")
         st.caption(f"Current issue: {selected_issue.strftime('%Y-%m-%d %H:%M') if hasattr(selected_issue, 'strftime') else str(selected_issue)} | Historical: {comparison_issue.strftime('%Y-%m-%d %H:%M') if hasattr(comparison_issue, 'strftime') else str(comparison_issue)}")
 
-        # Compute forecast horizon (valid times) as next 14 days to capture full forecast period
-        now = pd.Timestamp.utcnow()
-        valid_start = now.floor("h")
-        valid_end = now + pd.Timedelta(days=14)
+        # Forecast horizon (valid times) is the next 14 days from the current hour
+        hour_start = int(time.time()) // 3600 * 3600
 
         try:
             # Compare residual load (combines wind + solar)
-            residual_delta = engine.compute_residual_load_delta(
-                model=selected_model,
-                issue_new=selected_issue,
-                issue_old=comparison_issue,
-                valid_start=valid_start,
-                valid_end=valid_end,
-                location=issue_location,
+            residual_delta = residual_load_delta(
+                engine, selected_model, selected_issue, comparison_issue, issue_location, hour_start
             )
 
             if not residual_delta.empty:
@@ -540,6 +695,7 @@ with tab_data:
 
     data_options = {
         "Residual Load Scenarios": "residual_scenarios",
+        "Crossed Percentile Scenarios": "percentile_scenarios",
         "Consumption": "consumption",
         "Renewable Ensembles": "renewables_ens",
     }
@@ -550,7 +706,7 @@ with tab_data:
     if isinstance(df, pd.DataFrame) and not df.empty:
         st.dataframe(df, use_container_width=True, height=400)
 
-        csv = df.to_csv(index=False)
+        csv = to_csv_bytes(df)
         st.download_button(
             label=f"📥 Download {selected_data} CSV",
             data=csv,
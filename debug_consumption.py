@@ -1,8 +1,8 @@
-from sqlalchemy import create_engine, text
-from config import DB_CONNECTION_STRING
+from sqlalchemy import text
+from config import get_engine
 import pandas as pd
 
-engine = create_engine(DB_CONNECTION_STRING)
+engine = get_engine()
 
 print("=" * 80)
 print("Debugging EQ Consumption")
@@ -16,22 +16,20 @@ with engine.connect() as conn:
             COUNT(*) as total_rows,
             COUNT(consumption_act) as act_count,
             COUNT(da_consumption_fcst) as da_count,
-            COUNT(consumption_fcst_latest) as latest_count
+            COUNT(consumption_fcst_latest) as latest_count,
+            MIN(utc_datetime) as min_dt,
+            MAX(utc_datetime) as max_dt
         FROM silver.eq_consumption
         WHERE country = 'FR'
     """))
-    row = result.fetchone()
-    print(f"   Total rows: {row[0]}")
-    print(f"   consumption_act: {row[1]} non-null")
-    print(f"   da_consumption_fcst: {row[2]} non-null")
-    print(f"   consumption_fcst_latest: {row[3]} non-null")
+    total_rows, act_count, da_count, latest_count, min_dt, max_dt = result.one()
+    print(f"   Total rows: {total_rows}")
+    print(f"   consumption_act: {act_count} non-null")
+    print(f"   da_consumption_fcst: {da_count} non-null")
+    print(f"   consumption_fcst_latest: {latest_count} non-null")
     
-    # Check date range
+    # Check date range (same scan as the counts above)
     print("\n2. Checking date ranges:")
-    result = conn.execute(text("""
-        SELECT MIN(utc_datetime), MAX(utc_datetime) FROM silver.eq_consumption WHERE country='FR'
-    """))
-    min_dt, max_dt = result.fetchone()
     print(f"   Date range: {min_dt} to {max_dt}")
     
     # Sample data
@@ -43,5 +41,5 @@ with engine.connect() as conn:
         ORDER BY utc_datetime DESC
         LIMIT 10
     """))
-    for row in result:
-        print(f"   {row[0]}: act={row[1]}, da={row[2]}, latest={row[3]}")
+    for utc_datetime, act, da, latest in result:
+        print(f"   {utc_datetime}: act={act}, da={da}, latest={latest}")
@@ -1,8 +1,8 @@
-from sqlalchemy import create_engine, text, inspect
-from config import DB_CONNECTION_STRING
+from sqlalchemy import text, inspect
+from config import get_engine
 import pandas as pd
 
-engine = create_engine(DB_CONNECTION_STRING)
+engine = get_engine()
 
 # Check columns in eq_consumption
 print("=" * 80)
@@ -13,8 +13,7 @@ print("Columns:", [c['name'] for c in cols])
 
 # Try to fetch some data
 with engine.connect() as conn:
-    result = conn.execute(text("SELECT * FROM silver.eq_consumption LIMIT 5"))
-    df = pd.DataFrame(result.fetchall(), columns=[c['name'] for c in cols])
+    df = pd.read_sql(text("SELECT * FROM silver.eq_consumption LIMIT 5"), conn)
     print("\nSample data:")
     print(df)
     print(f"\nTotal rows: {conn.execute(text('SELECT COUNT(*) FROM silver.eq_consumption')).scalar()}")
@@ -30,8 +29,8 @@ with engine.connect() as conn:
         LIMIT 10
     """))
     print("Available element/model combinations:")
-    for row in result:
-        print(f"  {row[0]}/{row[1]}")
+    for element, model in result:
+        print(f"  {element}/{model}")
     
     # Check if we have recent data
     result = conn.execute(text("""
@@ -48,9 +48,10 @@ else:
 # ============================================================================
 print("\n[2] RENEWABLE ENSEMBLE DATA")
 print("-" * 80)
+ensembles = {}
 for model in ['eceps', 'ec46', 'gfsens', 'ecaifsens']:
     print(f"\n  {model.upper()}:")
-    renewables = client.get_renewable_ensembles(model)
+    renewables = ensembles[model] = client.get_renewable_ensembles(model)
     
     if not renewables.empty:
         print(f"    ✓ Data found: {renewables.shape[0]} rows x {renewables.shape[1]} cols")
@@ -111,8 +112,7 @@ print(f"  - GFS (gfsens): 15 days")
 print(f"  - AIFS (ecaifsens): 15 days")
 
 print("\nActual horizons from database:")
-for model in ['eceps', 'ec46', 'gfsens', 'ecaifsens']:
-    ren = client.get_renewable_ensembles(model)
+for model, ren in ensembles.items():  # fetched in [2]
     if not ren.empty:
         days_ahead = (ren['utc_datetime'].max() - now_utc).days
         print(f"  {model:12s}: {days_ahead:2d} days (until {ren['utc_datetime'].max().strftime('%Y-%m-%d %H:%M')})")
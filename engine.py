@@ -10,26 +10,144 @@ Data Sources:
 
 Supports:
     1. Ensemble scenarios (member-by-member residual loads)
-    2. Multi-model selection (eceps, ec46, gfsens, ecaifsens)
+    2. Crossed percentile scenarios (PERCENTILES_FOR_CROSSING)
+    3. Multi-model selection (eceps, ec46, gfsens, ecaifsens)
 """
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+import functools
+import glob
+import hashlib
+import json
 import logging
 import os
+import tempfile
+import time
+import uuid
 
 from config import (
     AVAILABLE_MODELS,
     METDESK_PERCENTILE_MEMBERS,
     METDESK_SPECIAL_MEMBERS,
+    PERCENTILE_LEVELS,
+    CROSSING_PERCENTILES,
+    SCENARIO_LABELS,
+    SCENARIO_DEMAND_COLS,
+    SCENARIO_RENEWABLES_COLS,
     DATA_DIR,
     COUNTRY,
+    REFRESH_INTERVAL_MINUTES,
 )
 from metdesk_db import MetDeskDBClient
 
 logger = logging.getLogger(__name__)
 
+# Scenarios for explicit issues, reused until consumption may have moved on
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+CACHE_MAX_AGE_S = REFRESH_INTERVAL_MINUTES * 60
+CACHE_MAX_ENTRIES = 8
+CACHED_FRAMES = ("residual_scenarios", "percentile_scenarios", "consumption", "renewables_ens")
+
+
+
+def _replace_atomic(path: str, write):
+    """Run write(tmp_path) on a fresh temp file next to path, then rename it over path."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+# Member column prefixes in renewables_ens; the groups are attached as attrs["col_groups"]
+MEMBER_COLUMN_PREFIXES = {"wind": "wind_ens_", "solar": "solar_ens_", "total": "total_ren_ens_"}
+
+
+@functools.lru_cache(maxsize=8)
+def member_column_groups(columns: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Member columns per MEMBER_COLUMN_PREFIXES group, classified by name (an empty tuple if absent)."""
+    return {
+        group: tuple(c for c in columns if str(c).startswith(prefix))
+        for group, prefix in MEMBER_COLUMN_PREFIXES.items()
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _member_columns(n_members: int) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """(wind_ens_XX, solar_ens_XX, residual_ens_XX) names for a model's member count, built once per count."""
+    members = range(1, n_members + 1)
+    return (
+        tuple(f"wind_ens_{i:02d}" for i in members),
+        tuple(f"solar_ens_{i:02d}" for i in members),
+        tuple(f"residual_ens_{i:02d}" for i in members),
+    )
+
+
+def _interpolate_sorted(ordered: np.ndarray, n_valid: np.ndarray, qs) -> np.ndarray:
+    """Linear-interpolated percentiles from rows already sorted along the last axis, NaNs last."""
+    q = np.asarray(qs, dtype=np.float64).reshape((-1,) + (1,) * n_valid.ndim) / 100.0
+    pos = q * np.maximum(n_valid - 1, 0)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, np.maximum(n_valid - 1, 0))
+    lo_vals = np.take_along_axis(ordered[np.newaxis], lo[..., np.newaxis], axis=-1)[..., 0]
+    hi_vals = np.take_along_axis(ordered[np.newaxis], hi[..., np.newaxis], axis=-1)[..., 0]
+    out = lo_vals + (pos - lo) * (hi_vals - lo_vals)
+    out[:, n_valid == 0] = np.nan
+    return out.astype(ordered.dtype, copy=False)
+
+
+def ensemble_percentiles(values: np.ndarray, qs) -> np.ndarray:
+    """
+    Percentiles over the last axis (ensemble members), ignoring NaN members.
+
+    Same result as np.nanpercentile(values, qs, axis=-1) with linear interpolation,
+    but one sort serves every q and rows with missing members stay vectorised
+    (nanpercentile falls back to a per-row Python loop once any NaN is present).
+    Returns shape (len(qs), *values.shape[:-1]).
+    """
+    # A full sort beats np.partition here: 21 levels over ~51 members need ~41 kth positions,
+    # and multi-kth partition of a (1104, 51) block measured ~40x slower than np.sort.
+    ordered = np.sort(values, axis=-1)  # NaNs sort to the end
+    return _interpolate_sorted(ordered, np.count_nonzero(~np.isnan(ordered), axis=-1), qs)
+
+
+def ensemble_stats(values: np.ndarray, qs):
+    """
+    Mean, std (ddof=0) and percentiles over the last axis, ignoring NaN members.
+
+    One sort and one NaN mask feed every statistic, instead of separate
+    nanmean/nanstd/nanpercentile passes that each re-mask the whole block.
+    Returns (mean, std, percentiles) with percentiles shaped as ensemble_percentiles.
+    """
+    ordered = np.sort(values, axis=-1)  # NaNs sort to the end
+    valid = ~np.isnan(ordered)
+    n_valid = np.count_nonzero(valid, axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):  # all-NaN rows come out NaN
+        mean = np.where(valid, ordered, 0).sum(axis=-1) / n_valid
+        dev = np.where(valid, ordered - mean[..., np.newaxis], 0)
+        std = np.sqrt(np.einsum("...i,...i->...", dev, dev) / n_valid)
+    dtype = ordered.dtype
+    return mean.astype(dtype, copy=False), std.astype(dtype, copy=False), _interpolate_sorted(ordered, n_valid, qs)
+
+
+def residual_ensemble(consumption: np.ndarray, wind: np.ndarray, solar: np.ndarray, qs):
+    """
+    Residual load members and their statistics straight from (T, N) wind and solar member blocks.
+
+    consumption - (wind + solar) is formed in one C-ordered float32 buffer, so no
+    total-renewables block is read or materialised, and that buffer feeds ensemble_stats.
+    Returns (residual, mean, std, percentiles).
+    """
+    residual = np.add(wind, solar, dtype=np.float32, order="C")
+    np.subtract(np.asarray(consumption, dtype=np.float32)[:, np.newaxis], residual, out=residual)
+    return (residual, *ensemble_stats(residual, qs))
+
 
 class ResidualLoadEngine:
     """Compute French residual load scenarios."""
@@ -39,12 +157,88 @@ class ResidualLoadEngine:
         self.last_update: Optional[datetime] = None
         self.current_model: Optional[str] = None
         self.scenarios: Dict[str, pd.DataFrame] = {}
+        self._cache: Dict[str, tuple] = {}  # key -> (monotonic time, scenarios)
+
+    def fetch_inputs(
+        self,
+        model: str = "eceps",
+        issue: Optional[datetime] = None,
+        countries: Optional[List[str]] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch renewables and consumption, summed across countries.
+
+        Has no side effects on the engine, so it can run ahead of update()
+        (e.g. prefetched in a background thread) and be passed back in.
+
+        Returns dict with keys 'renewables_ens', 'consumption' and 'issue' (the
+        resolved issue time), or {} if either input is unavailable.
+        """
+        # default to configured country if none provided
+        if countries is None or len(countries) == 0:
+            countries = [COUNTRY]
+
+        # =================================================================
+        # 1./2. FETCH RENEWABLES (MetDesk) AND CONSUMPTION (EQ) CONCURRENTLY
+        # =================================================================
+        logger.info(f"Step 1: Fetching renewable ensemble data from MetDesk for countries={countries}...")
+        logger.info(f"Step 2: Fetching consumption data from EQ for countries={countries}...")
+
+        # each fetch is a blocking DB round-trip, so overlap them on the shared connection pool
+        with ThreadPoolExecutor(max_workers=min(len(countries), 8) + 1) as pool:
+            # consumption summed across countries in one query
+            consumption_future = pool.submit(
+                self.metdesk.get_eq_consumption_multi, [c.lower() for c in countries], issue
+            )
+            ren_list = [
+                df
+                for df in pool.map(
+                    lambda c: self.metdesk.get_renewable_ensembles(model, issue, location=c.upper()), countries
+                )
+                if not df.empty
+            ]
+            consumption = consumption_future.result()
+
+        if not ren_list:
+            logger.error("FAILED: No renewable ensemble data for selected countries. Cannot compute residual loads.")
+            return {}
+
+        # aggregate by summing member columns across countries (align on utc_datetime)
+        # The members end up as one contiguous float32 (T, C) block behind the frame, so every
+        # downstream member selection/percentile reads a single array instead of C column blocks.
+        indexed = [df.set_index("utc_datetime") for df in ren_list]
+        if len(indexed) == 1:
+            index, columns = indexed[0].index, indexed[0].columns
+            total = indexed[0].to_numpy(dtype=np.float32)
+        else:
+            # one stacked sum over the union grid; a missing value counts as 0 unless every country misses it
+            index = indexed[0].index
+            for df_idx in indexed[1:]:
+                if not df_idx.index.equals(index):
+                    index = index.union(df_idx.index)
+            columns = pd.Index(dict.fromkeys(c for df_idx in indexed for c in df_idx.columns))
+            stack = np.stack([
+                df_idx.reindex(index=index, columns=columns).to_numpy(dtype=np.float32) for df_idx in indexed
+            ])
+            total = np.nansum(stack, axis=0)
+            total[np.isnan(stack).all(axis=0)] = np.nan
+        ren_ens = pd.DataFrame(total, index=index, columns=columns).reset_index()
+        # classify member columns once here so consumers don't re-scan column names
+        ren_ens.attrs = {"col_groups": dict(member_column_groups(tuple(ren_ens.columns)))}
+
+        if consumption.empty:
+            logger.error("FAILED: No consumption data. Cannot compute residual loads.")
+            return {}
+
+        # issue the MetDesk fetch actually used (first country), for the run metadata
+        return {"renewables_ens": ren_ens, "consumption": consumption, "issue": ren_list[0].attrs.get("issue")}
 
     def update(
         self,
         model: str = "eceps",
         issue: Optional[datetime] = None,
         countries: Optional[List[str]] = None,
+        inputs: Optional[Dict[str, pd.DataFrame]] = None,
     ) -> Dict[str, pd.DataFrame]:
         """
         Fetch latest forecasts and compute all scenario types.
@@ -52,6 +246,7 @@ class ResidualLoadEngine:
         Args:
             model: NWP model to use for renewables ('eceps', 'ec46', 'gfsens', 'ecaifsens')
             issue: Specific issue time, or None for latest
+            inputs: Result of fetch_inputs() for the same arguments, to skip the DB fetch
 
         Returns dict with keys:
             - 'percentile_scenarios': crossed percentile residual load
@@ -64,92 +259,63 @@ class ResidualLoadEngine:
         logger.info(f"Updating residual load scenarios (model={model}, issue={issue})")
         self.current_model = model
 
-        # =================================================================
-        # 1. FETCH RENEWABLE DATA FROM POSTGRESQL (MetDesk)
-        # =================================================================
-        logger.info(f"Step 1: Fetching renewable ensemble data from MetDesk for countries={countries}...")
         # default to configured country if none provided
         if countries is None or len(countries) == 0:
             countries = [COUNTRY]
 
-        # fetch and aggregate renewable ensembles across selected countries
-        ren_list = []
-        for c in countries:
-            df = self.metdesk.get_renewable_ensembles(model, issue, location=c.upper())
-            if not df.empty:
-                ren_list.append(df)
-
-        if not ren_list:
-            logger.error("FAILED: No renewable ensemble data for selected countries. Cannot compute residual loads.")
-            return {}
-
-        # aggregate by summing member columns across countries (align on utc_datetime)
-        ren_agg = None
-        for df in ren_list:
-            df_idx = df.set_index("utc_datetime")
-            if ren_agg is None:
-                ren_agg = df_idx.copy()
-            else:
-                ren_agg = ren_agg.add(df_idx, fill_value=0)
-        ren_ens = ren_agg.reset_index()
-
-        # =================================================================
-        # 2. FETCH CONSUMPTION DATA FROM EQ
-        # =================================================================
-        logger.info(f"Step 2: Fetching consumption data from EQ for countries={countries}...")
-        # fetch and sum consumption across countries
-        cons_list = []
-        for c in countries:
-            dfc = self.metdesk.get_eq_consumption(issue, location=c.lower())
-            if not dfc.empty:
-                cons_list.append(dfc)
-
-        if not cons_list:
-            logger.error("FAILED: No consumption data for selected countries. Cannot compute residual loads.")
-            return {}
-
-        # concat and sum by utc_datetime
-        cons_concat = pd.concat(cons_list, ignore_index=True)
-        consumption = (
-            cons_concat.groupby("utc_datetime", as_index=False)["consumption_mw"].sum().sort_values("utc_datetime")
-        )
-        
-        if consumption.empty:
-            logger.error("FAILED: No consumption data. Cannot compute residual loads.")
+        # an explicit issue never changes upstream, so reuse a recent result for it
+        cache_key = self._cache_key(model, issue, countries) if issue is not None else None
+        if cache_key and inputs is None:
+            cached = self._load_cached(cache_key, model, issue, countries)
+            if cached:
+                logger.info(f"Using cached scenarios for {model} {issue} ({cache_key})")
+                self.scenarios = cached
+                self.last_update = cached["metadata"]["updated_at"]
+                return self.scenarios
+
+        if inputs is None:
+            inputs = self.fetch_inputs(model, issue, countries)
+        if not inputs:
             return {}
+        ren_ens = inputs["renewables_ens"]
+        consumption = inputs["consumption"]
 
         # =================================================================
         # 3. COMPUTE RESIDUAL LOAD SCENARIOS
         # =================================================================
         logger.info("Step 3: Computing residual load scenarios...")
         residual_scenarios = self._compute_residual_scenarios(consumption, ren_ens, model)
+        percentile_scenarios = self._compute_percentile_scenarios(consumption, ren_ens)
 
         # =================================================================
         # 5. GET ISSUE TIME FOR METADATA
         # =================================================================
-        # attempt to get an issue time for metadata (use first country)
-        first_loc = countries[0].upper() if countries else COUNTRY.upper()
-        actual_issue = self.metdesk._get_latest_issue(model, "wind", location=first_loc) if issue is None else issue
+        # issue resolved during the fetch (first country), no extra lookup
+        actual_issue = issue if issue is not None else inputs.get("issue")
 
         # =================================================================
         # 6. STORE RESULTS
         # =================================================================
+        now = datetime.utcnow()
         self.scenarios = {
             "residual_scenarios": residual_scenarios,
+            "percentile_scenarios": percentile_scenarios,
             "consumption": consumption,
             "renewables_ens": ren_ens,
             "metadata": {
                 "model": model,
                 "model_label": AVAILABLE_MODELS[model]["label"],
                 "issue": actual_issue,
-                "updated_at": datetime.utcnow(),
+                "updated_at": now,
                 "n_members": AVAILABLE_MODELS[model]["n_members"],
                 "countries": countries,
             },
         }
-        self.last_update = datetime.utcnow()
+        self.last_update = now
 
-        self._save_to_disk(model)
+        self._save_to_disk(model, now.strftime("%Y%m%d_%H%M"))
+        if cache_key:
+            self._store_cached(cache_key)
         logger.info(f"Scenarios updated at {self.last_update.strftime('%Y-%m-%d %H:%M UTC')}")
         return self.scenarios
 
@@ -164,6 +330,8 @@ class ResidualLoadEngine:
 
         Residual Load = Consumption (EQ) - Total Renewables (Wind + Solar)
         For each ensemble member: RL_i = Consumption - (Wind_i + Solar_i)
+
+        The (T, N) member block is kept C-contiguous: every statistic reduces along members.
         """
         if consumption.empty:
             logger.warning("No consumption data available.")
@@ -173,44 +341,88 @@ class ResidualLoadEngine:
             logger.warning("No renewable ensemble data available.")
             return pd.DataFrame()
 
-        # Merge consumption and renewables by datetime
-        merged = consumption.merge(ren_ens, on="utc_datetime", how="inner")
+        # Align consumption and renewables on their common timestamps (both keyed uniquely by hour)
+        cons_idx = consumption.set_index("utc_datetime")["consumption_mw"]
+        ren_idx = ren_ens.set_index("utc_datetime")
+        common = cons_idx.index.intersection(ren_idx.index)
 
-        if merged.empty:
+        if common.empty:
             logger.warning("No overlapping data between consumption and renewables.")
             return pd.DataFrame()
 
-        result = pd.DataFrame({"utc_datetime": merged["utc_datetime"]})
-
-        n_members = AVAILABLE_MODELS[model]["n_members"]
-        ens_cols = []
-
-        # Compute residual load for each ensemble member
-        for i in range(1, n_members + 1):
-            ren_col = f"total_ren_ens_{i:02d}"
-            if ren_col in merged.columns:
-                # Residual Load = Consumption - Renewables
-                result[f"residual_ens_{i:02d}"] = merged["consumption_mw"] - merged[ren_col]
-                ens_cols.append(f"residual_ens_{i:02d}")
-
-        # Compute ensemble statistics over all members
-        if ens_cols:
-            values = result[ens_cols].values
-            result["ens_mean"] = np.nanmean(values, axis=1)
-            result["ens_std"] = np.nanstd(values, axis=1)
-            result["ens_min"] = np.nanmin(values, axis=1)
-            result["ens_max"] = np.nanmax(values, axis=1)
-            
-            # Compute detailed percentiles (P0, P5, P10, ..., P95, P100)
-            for p in range(0, 101, 5):
-                result[f"ens_P{p}"] = np.nanpercentile(values, p, axis=1)
-
-            logger.info(f"Computed residual load for {len(ens_cols)} ensemble members with percentiles P0-P100")
-        else:
+        wind_cols, solar_cols, ens_cols = _member_columns(AVAILABLE_MODELS[model]["n_members"])
+        present = [
+            j for j, (w, s) in enumerate(zip(wind_cols, solar_cols))
+            if w in ren_idx.columns and s in ren_idx.columns
+        ]
+        if len(present) < len(ens_cols):
+            # partial ensemble: keep only the members that arrived
+            wind_cols, solar_cols, ens_cols = (
+                tuple(cols[j] for j in present) for cols in (wind_cols, solar_cols, ens_cols)
+            )
+        ens_cols = list(ens_cols)
+        if not ens_cols:
             logger.warning("No ensemble members found in renewable data.")
-
+            return pd.DataFrame({"utc_datetime": common})
+
+        # Residual Load = Consumption - (Wind + Solar), for all members in one (T, N) float32 block
+        # (ample for MW values, and half the bytes every stats pass reads). Built from the wind and
+        # solar blocks directly, C-ordered so the row-wise (axis=1) sort and stats read unit-stride
+        # memory; mean, std and P0..P100 then come from one sort of each row.
+        cons = cons_idx.reindex(common).to_numpy(dtype=np.float32)
+        wind = ren_idx[list(wind_cols)].reindex(common).to_numpy(dtype=np.float32)
+        solar = ren_idx[list(solar_cols)].reindex(common).to_numpy(dtype=np.float32)
+        values, mean, std, pcts = residual_ensemble(cons, wind, solar, PERCENTILE_LEVELS)
+
+        stats = {
+            "ens_mean": mean,
+            "ens_std": std,
+            "ens_min": pcts[0],  # P0
+            "ens_max": pcts[-1],  # P100
+        }
+        stats.update({f"ens_P{p}": q for p, q in zip(PERCENTILE_LEVELS, pcts)})
+        result = pd.concat(
+            [
+                pd.DataFrame({"utc_datetime": common}),
+                pd.DataFrame(values, columns=ens_cols),
+                pd.DataFrame(stats),
+            ],
+            axis=1,
+        )
+        logger.info(f"Computed residual load for {len(ens_cols)} ensemble members with percentiles P0-P100")
         return result
 
+    def _compute_percentile_scenarios(self, consumption: pd.DataFrame, ren_ens: pd.DataFrame) -> pd.DataFrame:
+        """
+        Crossed percentile residual load, one column per PERCENTILES_FOR_CROSSING scenario.
+
+        Demand is the single EQ consumption forecast, so every demand level is that series
+        (broadcast, not copied); renewables levels are percentiles of the total-renewables
+        members. All scenarios then come from one fancy-indexed subtraction.
+        """
+        total_cols = list(member_column_groups(tuple(ren_ens.columns))["total"])
+        if consumption.empty or not total_cols:
+            return pd.DataFrame()
+
+        cons_idx = consumption.set_index("utc_datetime")["consumption_mw"]
+        ren_idx = ren_ens.set_index("utc_datetime")
+        common = cons_idx.index.intersection(ren_idx.index)
+        if common.empty:
+            return pd.DataFrame()
+
+        # (T, 5) matrices ordered as CROSSING_LEVELS
+        renewables = ensemble_percentiles(
+            ren_idx[total_cols].reindex(common).to_numpy(dtype=np.float32), CROSSING_PERCENTILES
+        ).T
+        demand = np.broadcast_to(
+            cons_idx.reindex(common).to_numpy(dtype=np.float32)[:, np.newaxis], renewables.shape
+        )
+        values = demand[:, SCENARIO_DEMAND_COLS] - renewables[:, SCENARIO_RENEWABLES_COLS]
+        return pd.concat(
+            [pd.DataFrame({"utc_datetime": common}), pd.DataFrame(values, columns=SCENARIO_LABELS)],
+            axis=1,
+        )
+
     def get_available_issues(self, model: str, location: Optional[str] = None) -> list:
         """Get available forecast issues for model selector (optionally per location)."""
         try:
@@ -222,15 +434,124 @@ class ResidualLoadEngine:
             logger.error(f"Error fetching available issues for {model} (location={location}): {e}")
             return []
 
-    def _save_to_disk(self, model: str):
-        """Save latest scenarios to CSV."""
-        ts = datetime.utcnow().strftime("%Y%m%d_%H%M")
+    def get_available_issues_by_model(self, location: Optional[str] = None) -> Dict[str, list]:
+        """Available issues for every model's selector, in one query (optionally per location)."""
+        if location:
+            location = location.upper()
+        found = self.metdesk.get_issues_bulk([(model, "wind") for model in AVAILABLE_MODELS], location=location)
+        return {model: issues for (model, _), issues in found.items()}
+
+    @staticmethod
+    def _cache_key(model: str, issue: datetime, countries: List[str]) -> str:
+        raw = repr((model, pd.Timestamp(issue).isoformat(), tuple(sorted(c.upper() for c in countries))))
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _load_cached(self, key: str, model: str, issue: datetime, countries: List[str]) -> Optional[dict]:
+        """Scenarios for key from memory, else from the parquet cache, if younger than CACHE_MAX_AGE_S."""
+        hit = self._cache.get(key)
+        if hit and time.monotonic() - hit[0] < CACHE_MAX_AGE_S:
+            return hit[1]
+
+        # The marker is written last and names the generation of frame files that is complete
+        marker = os.path.join(CACHE_DIR, f"{key}.json")
+        try:
+            written = os.path.getmtime(marker)
+            if time.time() - written >= CACHE_MAX_AGE_S:
+                return None
+            with open(marker) as f:
+                token = json.load(f)["token"]
+            scenarios = {
+                name: pd.read_parquet(os.path.join(CACHE_DIR, f"{key}.{token}_{name}.parquet"))
+                for name in CACHED_FRAMES
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+        scenarios["metadata"] = {
+            "model": model,
+            "model_label": AVAILABLE_MODELS[model]["label"],
+            "issue": issue,
+            "updated_at": datetime.utcfromtimestamp(written),
+            "n_members": AVAILABLE_MODELS[model]["n_members"],
+            "countries": countries,
+        }
+        self._cache[key] = (time.monotonic() - (time.time() - written), scenarios)
+        return scenarios
+
+    def _store_cached(self, key: str):
+        """Keep the current scenarios in memory and as parquet for other processes/sessions."""
+        self._cache.pop(key, None)
+        self._cache[key] = (time.monotonic(), self.scenarios)
+        while len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.pop(next(iter(self._cache)))
+        # Other sessions/processes read this cache: every file goes through a temp file and a
+        # rename, each run writes its own generation of frames, and the marker naming that
+        # generation comes last, so a reader never sees a partial file or a mix of two runs.
+        token = uuid.uuid4().hex
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            for name in CACHED_FRAMES:
+                _replace_atomic(
+                    os.path.join(CACHE_DIR, f"{key}.{token}_{name}.parquet"),
+                    lambda tmp, name=name: self.scenarios[name].to_parquet(tmp, index=False),
+                )
+
+            def write_marker(tmp):
+                with open(tmp, "w") as f:
+                    json.dump({"token": token}, f)
+
+            _replace_atomic(os.path.join(CACHE_DIR, f"{key}.json"), write_marker)
+        except Exception as e:
+            logger.warning(f"Could not write scenario cache {key}: {e}")
+            return
+        # Earlier generations are unreachable now; readers holding them open keep their handles
+        for path in glob.glob(os.path.join(CACHE_DIR, f"{key}.*.parquet")):
+            if not os.path.basename(path).startswith(f"{key}.{token}_"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _save_to_disk(self, model: str, ts: str):
+        """Save latest scenarios to Parquet (binary, typed; CSV float formatting was the slow part)."""
+        path_base = os.path.join(DATA_DIR, f"{model}_")
         for name, data in self.scenarios.items():
             if isinstance(data, pd.DataFrame) and not data.empty:
-                path = os.path.join(DATA_DIR, f"{model}_{name}_{ts}.csv")
-                data.to_csv(path, index=False)
+                path = f"{path_base}{name}_{ts}.parquet"
+                data.to_parquet(path, engine="pyarrow", compression="snappy", index=False)
                 logger.info(f"Saved {name} -> {path}")
 
+    @staticmethod
+    def _as_utc(ts) -> pd.Timestamp:
+        ts = pd.Timestamp(ts)
+        return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+    def _ensemble_means(
+        self,
+        model: str,
+        elements: List[str],
+        issues: List[datetime],
+        valid_start: datetime,
+        valid_end: datetime,
+        location: str,
+    ) -> pd.DataFrame:
+        """Ensemble mean per (element, issue) and valid time: index utc_datetime, columns (element, UTC issue)."""
+        long_df = self.metdesk.get_ensemble_means_by_issues(
+            model, elements, issues, valid_start, valid_end, location=location
+        )
+        if long_df.empty:
+            return pd.DataFrame()
+        long_df["issue"] = pd.to_datetime(long_df["issue"], utc=True)
+        return long_df.pivot_table(
+            index="utc_datetime", columns=["element", "issue"], values="ens_mean", aggfunc="first"
+        )
+
+    def _issue_mean_frame(self, means: pd.DataFrame, element: str, issue: datetime) -> pd.DataFrame:
+        """[utc_datetime, ens_mean] for one element/issue out of _ensemble_means(), empty if absent."""
+        key = (element, self._as_utc(issue))
+        if means.empty or key not in means.columns:
+            return pd.DataFrame(columns=["utc_datetime", "ens_mean"])
+        return means[key].dropna().rename("ens_mean").rename_axis("utc_datetime").reset_index()
+
     def compute_forecast_delta(
         self,
         model: str,
@@ -241,6 +562,7 @@ class ResidualLoadEngine:
         valid_end: datetime,
         countries: Optional[List[str]] = None,
         location: Optional[str] = None,
+        means: Optional[pd.DataFrame] = None,
     ) -> pd.DataFrame:
         """
         Compare forecasts from two different issues (runs) at the same valid times.
@@ -254,6 +576,7 @@ class ResidualLoadEngine:
             valid_start, valid_end: time range to compare
             countries: list of country codes (for multi-country aggregation)
             location: single location code (if countries not provided)
+            means: result of _ensemble_means() covering this element and both issues
 
         Returns:
             DataFrame with columns: [utc_datetime, old_mean, new_mean, delta, delta_pct]
@@ -265,13 +588,11 @@ class ResidualLoadEngine:
 
         location = location.upper()
 
-        # Fetch forecasts for both issues
-        old_df = self.metdesk.get_ensemble_by_issue_and_time(
-            model, element, issue_old, valid_start, valid_end, location=location
-        )
-        new_df = self.metdesk.get_ensemble_by_issue_and_time(
-            model, element, issue_new, valid_start, valid_end, location=location
-        )
+        # Ensemble means for both issues (one query unless the caller already fetched them)
+        if means is None:
+            means = self._ensemble_means(model, [element], [issue_new, issue_old], valid_start, valid_end, location)
+        old_df = self._issue_mean_frame(means, element, issue_old)
+        new_df = self._issue_mean_frame(means, element, issue_new)
 
         if old_df.empty or new_df.empty:
             logger.warning(f"Missing data for {element} comparison: old={old_df.shape}, new={new_df.shape}")
@@ -329,45 +650,50 @@ class ResidualLoadEngine:
         if location is None:
             location = COUNTRY
 
-        # Get wind and solar deltas
+        # Get wind and solar deltas, both elements and both issues from a single query
+        means = self._ensemble_means(
+            model, ["wind", "solar"], [issue_new, issue_old], valid_start, valid_end, location.upper()
+        )
+        if means.empty:
+            logger.warning("Missing wind and solar data for residual delta computation")
+            return pd.DataFrame()
         wind_delta = self.compute_forecast_delta(
-            model, "wind", issue_new, issue_old, valid_start, valid_end, countries, location
+            model, "wind", issue_new, issue_old, valid_start, valid_end, countries, location, means
         )
         solar_delta = self.compute_forecast_delta(
-            model, "solar", issue_new, issue_old, valid_start, valid_end, countries, location
+            model, "solar", issue_new, issue_old, valid_start, valid_end, countries, location, means
         )
 
         if wind_delta.empty and solar_delta.empty:
             logger.warning("Missing wind and solar data for residual delta computation")
             return pd.DataFrame()
 
-        # Use outer merge to keep all times, fill missing with 0
-        if not wind_delta.empty and not solar_delta.empty:
-            result = pd.merge(
-                wind_delta[["utc_datetime", "delta"]].rename(columns={"delta": "wind_delta"}),
-                solar_delta[["utc_datetime", "delta"]].rename(columns={"delta": "solar_delta"}),
-                on="utc_datetime",
-                how="outer",
-            )
-        elif not wind_delta.empty:
-            result = wind_delta[["utc_datetime", "delta"]].rename(columns={"delta": "wind_delta"}).copy()
-            result["solar_delta"] = 0.0
-        else:
-            result = solar_delta[["utc_datetime", "delta"]].rename(columns={"delta": "solar_delta"}).copy()
-            result["wind_delta"] = 0.0
-
-        if result.empty:
+        # Align both deltas on the union of their times; a missing component counts as 0
+        deltas = {
+            name: df.set_index("utc_datetime")["delta"]
+            for name, df in (("wind_delta", wind_delta), ("solar_delta", solar_delta))
+            if not df.empty
+        }
+        index = None
+        for series in deltas.values():
+            index = series.index if index is None else index.union(series.index)
+        index = index.sort_values()
+        if index.empty:
             return pd.DataFrame()
 
-        result = result.sort_values("utc_datetime").reset_index(drop=True)
-        result["wind_delta"] = result["wind_delta"].fillna(0)
-        result["solar_delta"] = result["solar_delta"].fillna(0)
-
+        columns = {
+            name: np.nan_to_num(deltas[name].reindex(index).to_numpy(dtype=np.float64)) if name in deltas
+            else np.zeros(len(index))
+            for name in ("wind_delta", "solar_delta")
+        }
         # Residual delta: negative because if wind+solar increase, residual load decreases
-        result["residual_delta"] = -(result["wind_delta"] + result["solar_delta"])
-        
-        # Approximate percentage (using mean of old values)
-        result["residual_delta_pct"] = (result["residual_delta"] / 100.0) * 100  # Normalize
+        residual_delta = -(columns["wind_delta"] + columns["solar_delta"])
+        result = pd.DataFrame({
+            "utc_datetime": index,
+            **columns,
+            "residual_delta": residual_delta,
+            "residual_delta_pct": residual_delta / 100.0 * 100,  # Normalize (approximate percentage)
+        })
 
         logger.info(f"Computed residual delta: {len(result)} points from {result['utc_datetime'].min()} to {result['utc_datetime'].max()}")
         return result
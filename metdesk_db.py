@@ -7,67 +7,338 @@ Supports:
 - Individual ensemble members
 - Special members (control, mean, median)
 """
+import functools
+import io
+import os
+import re
+import time
+
 import pandas as pd
 import numpy as np
-from sqlalchemy import create_engine, text
-from datetime import datetime, timedelta
-from typing import Optional, List
+from sqlalchemy import text
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from config import (
-    DB_CONNECTION_STRING,
+    get_engine,
     METDESK_TABLE,
     COUNTRY,
     AVAILABLE_MODELS,
     METDESK_PERCENTILE_MEMBERS,
     METDESK_SPECIAL_MEMBERS,
     FORECAST_HORIZON_DAYS,
+    DATA_DIR,
 )
 
 logger = logging.getLogger(__name__)
 
+# Latest issue per (model, element, location), so one refresh resolves each at most once.
+# Short-lived, and cleared before every scheduled, manual or prefetched latest-issue load.
+ISSUE_CACHE_TTL_S = 60
+_ISSUE_CACHE: dict = {}  # key -> (monotonic time, issue)
+
+
+def clear_issue_cache():
+    """Forget every cached latest issue."""
+    _ISSUE_CACHE.clear()
+
+
+# Pivoted frames per (kind, model, element, location, issue). An issue never changes once
+# published, so entries stay valid; the directory is kept to the most recently used files.
+FRAME_CACHE_DIR = os.path.join(DATA_DIR, "cache", "metdesk")
+FRAME_CACHE_MAX_FILES = 64
+
+
+def _frame_cache_path(kind: str, model: str, element: str, location: str, issue) -> str:
+    stamp = pd.Timestamp(issue).strftime("%Y%m%dT%H%M%S")
+    return os.path.join(FRAME_CACHE_DIR, f"{kind}_{model}_{element}_{location}_{stamp}.parquet")
+
+
+def _load_frame(path: str) -> Optional[pd.DataFrame]:
+    """The cached frame at path, or None; a hit refreshes its mtime for eviction."""
+    try:
+        df = pd.read_parquet(path)
+        os.utime(path)
+        return df
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read frame cache {path}: {e}")
+        return None
+
+
+def _store_frame(path: str, df: pd.DataFrame):
+    """Write df to the frame cache, then drop the least recently used files over the limit."""
+    try:
+        os.makedirs(FRAME_CACHE_DIR, exist_ok=True)
+        df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        with os.scandir(FRAME_CACHE_DIR) as entries:
+            files = sorted((e.stat().st_mtime, e.path) for e in entries if e.name.endswith(".parquet"))
+        for _, stale in files[:-FRAME_CACHE_MAX_FILES]:
+            os.remove(stale)
+    except Exception as e:
+        logger.warning(f"Could not write frame cache {path}: {e}")
+
+
+# Rows per chunk when streaming a result set through a server-side cursor
+READ_CHUNK_ROWS = 20000
+
+# Fixed statements, built once at import rather than on every call.
+# The table name is interpolated into them, so it must be a plain schema.table identifier.
+if not re.fullmatch(r"[A-Za-z_]\w*\.[A-Za-z_]\w*", METDESK_TABLE):
+    raise ValueError(f"METDESK_TABLE must be schema.table, got {METDESK_TABLE!r}")
+
+LATEST_ISSUE_SQL = text(f"""
+    SELECT MAX(issue) as latest_issue
+    FROM {METDESK_TABLE}
+    WHERE location = :location
+      AND model = :model
+      AND element = :element
+    LIMIT 1
+""")
+
+AVAILABLE_ISSUES_SQL = text(f"""
+    SELECT DISTINCT issue
+    FROM {METDESK_TABLE}
+    WHERE location = :location
+      AND model = :model
+      AND element = :element
+    ORDER BY issue DESC
+    LIMIT :n
+""")
+
+ENSEMBLE_BY_ISSUE_SQL = text(f"""
+    SELECT utc_datetime, member, value
+    FROM {METDESK_TABLE}
+    WHERE location = :location
+      AND model = :model
+      AND element = :element
+      AND issue = :issue
+      AND utc_datetime >= :valid_start
+      AND utc_datetime <= :valid_end
+    ORDER BY utc_datetime, member
+    LIMIT 50000
+""")
+
+ENSEMBLE_MEANS_BY_ISSUES_SQL = text(f"""
+    SELECT element, issue, utc_datetime, AVG(value) AS ens_mean
+    FROM {METDESK_TABLE}
+    WHERE location = :location
+      AND model = :model
+      AND element = ANY(:elements)
+      AND issue = ANY(:issues)
+      AND utc_datetime >= :valid_start
+      AND utc_datetime <= :valid_end
+    GROUP BY element, issue, utc_datetime
+    ORDER BY element, issue, utc_datetime
+""")
+
+EQ_CONSUMPTION_SQL = text("""
+    SELECT utc_datetime, 
+           COALESCE(consumption_fcst_latest, consumption_act) as consumption_mw
+    FROM silver.eq_consumption
+    WHERE LOWER(country) = :location
+      AND utc_datetime >= :cutoff
+    ORDER BY utc_datetime DESC
+    LIMIT 500
+""")
+
+EQ_CONSUMPTION_MULTI_SQL = text("""
+    SELECT utc_datetime, COALESCE(SUM(consumption_mw), 0) AS consumption_mw
+    FROM (
+        SELECT utc_datetime,
+               COALESCE(consumption_fcst_latest, consumption_act) AS consumption_mw,
+               ROW_NUMBER() OVER (PARTITION BY LOWER(country) ORDER BY utc_datetime DESC) AS rn
+        FROM silver.eq_consumption
+        WHERE LOWER(country) = ANY(:locations)
+          AND utc_datetime >= :cutoff
+    ) latest
+    WHERE rn <= 500
+    GROUP BY utc_datetime
+    ORDER BY utc_datetime
+""")
+
+
+def _recent_cutoff(days: int = 2) -> datetime:
+    """Naive UTC timestamp `days` ago, bound as :cutoff so the planner sees a constant."""
+    return datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+
+
+def _member_pivot(members: List[str], aliases: List[str]):
+    """
+    SELECT list that pivots long (member, value) rows wide in the database,
+    one conditional aggregate per member, plus the bind params it needs.
+    """
+    select = ",\n           ".join(
+        f'(MAX(value) FILTER (WHERE member = :m{i}))::real AS "{alias}"'
+        for i, alias in enumerate(aliases)
+    )
+    params = {f"m{i}": member for i, member in enumerate(members)}
+    return select, params
+
+
+PERCENTILE_MEMBERS = METDESK_PERCENTILE_MEMBERS + METDESK_SPECIAL_MEMBERS
+_percentile_select, PERCENTILE_MEMBER_PARAMS = _member_pivot(PERCENTILE_MEMBERS, PERCENTILE_MEMBERS)
+PERCENTILE_PIVOT_SQL = text(f"""
+    SELECT utc_datetime,
+           {_percentile_select}
+    FROM {METDESK_TABLE}
+    WHERE location = :location
+      AND model = :model
+      AND element = :element
+      AND issue = :issue
+      AND member = ANY(:members)
+    GROUP BY utc_datetime
+    ORDER BY utc_datetime
+""")
+
+
+@functools.lru_cache(maxsize=8)
+def _ensemble_pivot_sql(n_members: int):
+    """Wide ensemble statement and its member params for a model's member count, built once per count."""
+    # Numeric members only (exclude percentile and special members)
+    numeric_members = [str(i) for i in range(1, n_members + 1)]
+    # Columns come back already named "1" -> "ens_01", "2" -> "ens_02", etc.
+    member_select, member_params = _member_pivot(
+        numeric_members, [f"ens_{i:02d}" for i in range(1, n_members + 1)]
+    )
+    query = text(f"""
+        SELECT utc_datetime,
+               {member_select}
+        FROM {METDESK_TABLE}
+        WHERE location = :location
+          AND model = :model
+          AND element = :element
+          AND issue = :issue
+          AND member = ANY(:members)
+          AND utc_datetime >= :cutoff
+        GROUP BY utc_datetime
+        ORDER BY utc_datetime
+        LIMIT :row_limit
+    """)
+    # 50000 long rows used to be the cap; the same budget in wide rows
+    params = {"members": numeric_members, "row_limit": 50000 // n_members, **member_params}
+    return query, params
+
+
+@functools.lru_cache(maxsize=8)
+def _issues_bulk_sql(n_pairs: int):
+    """
+    Latest-N issues for n_pairs (model, element) pairs in one statement, built once per pair count.
+    Driven from the pairs: each LATERAL probe walks the (location, model, element, issue) index
+    backwards and stops after N issues, instead of reading the location's whole issue history.
+    """
+    pairs = ", ".join(f"(:m{i}, :e{i})" for i in range(n_pairs))
+    return text(f"""
+        SELECT p.model, p.element, latest.issue
+        FROM (VALUES {pairs}) AS p(model, element)
+        CROSS JOIN LATERAL (
+            SELECT DISTINCT issue
+            FROM {METDESK_TABLE}
+            WHERE location = :location
+              AND model = p.model
+              AND element = p.element
+            ORDER BY issue DESC
+            LIMIT :n
+        ) latest
+        ORDER BY p.model, p.element, latest.issue DESC
+    """)
+
+
+def _as_member_block(frame: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+    """
+    Replace the member columns with one float32 block. No memory layout is forced:
+    any column selection downstream re-materialises the block anyway, so the
+    consumers (residual_ensemble, ensemble_percentiles) make the one row-major copy.
+    """
+    block = pd.DataFrame(
+        frame[cols].to_numpy(dtype=np.float32),
+        index=frame.index,
+        columns=cols,
+        copy=False,
+    )
+    return pd.concat([frame.drop(columns=cols), block], axis=1)
+
+
+def _side_by_side(wind: pd.DataFrame, solar: pd.DataFrame) -> pd.DataFrame:
+    """
+    Wind and solar columns on a shared utc_datetime axis, zero wherever a value is missing.
+    Both come from the same issue, so their hours normally match and this is a
+    plain column concat; otherwise concat aligns on the sorted union. Gaps are
+    zero-filled either way, as the outer merge did.
+    """
+    wind = wind.set_index("utc_datetime")
+    solar = solar.set_index("utc_datetime")
+    aligned = wind.index.equals(solar.index)
+    df = pd.concat([wind, solar], axis=1, sort=not aligned).fillna(np.float32(0))
+    return df.rename_axis("utc_datetime").reset_index()
+
 
 class MetDeskDBClient:
     """Client for MetDesk data stored in PostgreSQL."""
 
-    def __init__(self):
-        self._engine = None
-
     @property
     def engine(self):
-        if self._engine is None:
-            # Add connection pool settings (timeout handled via statement_timeout)
-            self._engine = create_engine(
-                DB_CONNECTION_STRING,
-                pool_size=3,
-                max_overflow=5,
-                pool_pre_ping=True,
-                pool_recycle=3600,
+        # Process-wide pool, shared by every client/session (see config.get_engine)
+        return get_engine()
+
+    def _read_sql_streamed(self, query, params: dict, parse_dates=None) -> pd.DataFrame:
+        """
+        read_sql over a server-side (named) cursor, in chunks.
+        Rows are fetched READ_CHUNK_ROWS at a time instead of the whole result
+        set being buffered client-side before the DataFrame is built.
+        """
+        with self.engine.connect().execution_options(
+            stream_results=True, max_row_buffer=READ_CHUNK_ROWS
+        ) as conn:
+            frames = list(
+                pd.read_sql(query, conn, params=params, parse_dates=parse_dates, chunksize=READ_CHUNK_ROWS)
             )
-        return self._engine
+        if not frames:
+            return pd.DataFrame()
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def _copy_query(self, query, params: dict, dtype: Optional[dict] = None) -> pd.DataFrame:
+        """
+        Run a SELECT through COPY ... TO STDOUT and parse the CSV stream.
+        Skips psycopg2's per-row tuple conversion, which dominates read_sql
+        on the long ensemble queries.
+        """
+        sql = str(query.compile(dialect=self.engine.dialect))
+        conn = self.engine.raw_connection()
+        try:
+            with conn.cursor() as cur:
+                bound = cur.mogrify(sql, params).decode()
+                buf = io.BytesIO()
+                cur.copy_expert(f"COPY ({bound}) TO STDOUT WITH (FORMAT CSV, HEADER)", buf)
+        finally:
+            conn.close()
+        buf.seek(0)
+        # pyarrow's reader is multi-threaded and columnar, and parses the timestamps itself
+        return pd.read_csv(buf, engine="pyarrow", dtype=dtype)
 
     def _get_latest_issue(self, model: str, element: str, location: Optional[str] = None) -> Optional[datetime]:
         """Get the most recent issue (forecast run) time for a model/element for a location."""
         if location is None:
             location = COUNTRY
 
-        query = text(f"""
-            SELECT MAX(issue) as latest_issue
-            FROM {METDESK_TABLE}
-            WHERE location = :location
-              AND model = :model
-              AND element = :element
-            LIMIT 1
-        """)
+        key = (model, element, location)
+        hit = _ISSUE_CACHE.get(key)
+        if hit and time.monotonic() - hit[0] < ISSUE_CACHE_TTL_S:
+            return hit[1]
+
         try:
             with self.engine.connect() as conn:
                 result = conn.execute(
-                    query, {"location": location, "model": model, "element": element}
+                    LATEST_ISSUE_SQL, {"location": location, "model": model, "element": element}
                 )
-                row = result.fetchone()
-                if row and row[0]:
-                    logger.info(f"Latest issue for {model}/{element} ({location}): {row[0]}")
-                    return row[0]
+                latest_issue = result.scalar()
+                if latest_issue:
+                    logger.info(f"Latest issue for {model}/{element} ({location}): {latest_issue}")
+                    _ISSUE_CACHE[key] = (time.monotonic(), latest_issue)
+                    return latest_issue
                 else:
                     logger.warning(f"No data found for {model}/{element}/{location}")
                     return None
@@ -99,45 +370,38 @@ class MetDeskDBClient:
                 logger.warning(f"No data found for {model}/{element}")
                 return pd.DataFrame()
 
-        members = METDESK_PERCENTILE_MEMBERS + METDESK_SPECIAL_MEMBERS
-
         if location is None:
             location = COUNTRY
 
-        query = text(f"""
-            SELECT utc_datetime, member, value
-            FROM {METDESK_TABLE}
-            WHERE location = :location
-              AND model = :model
-              AND element = :element
-              AND issue = :issue
-              AND member = ANY(:members)
-            ORDER BY utc_datetime, member
-        """)
-
-        with self.engine.connect() as conn:
-            df = pd.read_sql(
-                query,
-                conn,
-                params={
-                    "location": location,
-                    "model": model,
-                    "element": element,
-                    "issue": issue,
-                    "members": members,
-                },
-            )
+        cache_path = _frame_cache_path("pct", model, element, location, issue)
+        cached = _load_frame(cache_path)
+        if cached is not None:
+            return cached
+
+        # Pivoted in the database: one column per percentile/special member
+        pivot = self._read_sql_streamed(
+            PERCENTILE_PIVOT_SQL,
+            {
+                "location": location,
+                "model": model,
+                "element": element,
+                "issue": issue,
+                "members": PERCENTILE_MEMBERS,
+                **PERCENTILE_MEMBER_PARAMS,
+            },
+            parse_dates={"utc_datetime": {"utc": True}},
+        )
 
-        if df.empty:
+        if pivot.empty:
             logger.warning(f"No percentile data for {model}/{element} issue={issue}")
             return pd.DataFrame()
 
-        # Pivot: rows=utc_datetime, columns=member, values=value
-        pivot = df.pivot_table(
-            index="utc_datetime", columns="member", values="value", aggfunc="first"
-        ).reset_index()
-        pivot["utc_datetime"] = pd.to_datetime(pivot["utc_datetime"], utc=True)
-        pivot = pivot.sort_values("utc_datetime").reset_index(drop=True)
+        # Members absent from this run come back as all-NULL columns; drop them
+        pivot = pivot.dropna(axis=1, how="all")
+        value_cols = pivot.columns.drop("utc_datetime")
+        pivot[value_cols] = pivot[value_cols].astype(np.float32)
+        if len(value_cols) == len(PERCENTILE_MEMBERS):
+            _store_frame(cache_path, pivot)
 
         logger.info(
             f"Fetched {element} percentiles ({model}): {len(pivot)} hours, issue={issue}"
@@ -166,69 +430,55 @@ class MetDeskDBClient:
             location = COUNTRY
 
         if issue is None:
-            issue = self._get_latest_issue(model, element)
+            issue = self._get_latest_issue(model, element, location=location)
             if issue is None:
-                logger.warning(f"No data found for {model}/{element}/{COUNTRY}")
+                logger.warning(f"No data found for {model}/{element}/{location}")
                 return pd.DataFrame()
-        n_members = AVAILABLE_MODELS[model]["n_members"]
-        # Numeric members only (exclude percentile and special members)
-        numeric_members = [str(i) for i in range(1, n_members + 1)]
+        cutoff = _recent_cutoff()
+        cache_path = _frame_cache_path("ens", model, element, location, issue)
+        cached = _load_frame(cache_path)
+        if cached is not None:
+            # same two-day lookback the query applies
+            pivot = cached[cached["utc_datetime"] >= pd.Timestamp(cutoff, tz="UTC")].reset_index(drop=True)
+            pivot = _as_member_block(pivot, [c for c in pivot.columns if c.startswith("ens_")])
+            pivot.attrs["issue"] = issue
+            return pivot
 
-        query = text(f"""
-            SELECT utc_datetime, member, value
-            FROM {METDESK_TABLE}
-            WHERE location = :location
-              AND model = :model
-              AND element = :element
-              AND issue = :issue
-              AND member = ANY(:members)
-              AND utc_datetime >= CURRENT_TIMESTAMP AT TIME ZONE 'UTC' - INTERVAL '2 days'
-            ORDER BY utc_datetime, member
-            LIMIT 50000
-        """)
+        query, member_params = _ensemble_pivot_sql(AVAILABLE_MODELS[model]["n_members"])
 
         try:
             logger.info(f"Fetching {element} ensemble ({model}) from issue {issue}...")
-            with self.engine.connect() as conn:
-                df = pd.read_sql(
-                    query,
-                    conn,
-                    params={
-                        "location": location,
-                        "model": model,
-                        "element": element,
-                        "issue": issue,
-                        "members": numeric_members,
-                    },
-                )
+            pivot = self._copy_query(
+                query,
+                {
+                    "location": location,
+                    "model": model,
+                    "element": element,
+                    "issue": issue,
+                    "cutoff": cutoff,
+                    **member_params,
+                },
+            )
         except Exception as e:
             logger.error(f"Error fetching ensemble forecasts: {e}")
             return pd.DataFrame()
 
-        if df.empty:
+        if pivot.empty:
             logger.warning(f"No ensemble data for {model}/{element} issue={issue}")
             return pd.DataFrame()
 
-        # Pivot wide: one column per member
-        pivot = df.pivot_table(
-            index="utc_datetime", columns="member", values="value", aggfunc="first"
-        ).reset_index()
-
-        # Rename columns: "1" -> "ens_01", "2" -> "ens_02", etc.
-        rename_map = {}
-        for col in pivot.columns:
-            if col != "utc_datetime":
-                try:
-                    rename_map[col] = f"ens_{int(col):02d}"
-                except ValueError:
-                    rename_map[col] = f"ens_{col}"
-        pivot = pivot.rename(columns=rename_map)
-
+        # Members absent from this run come back as all-NULL columns; drop them
+        pivot = pivot.dropna(axis=1, how="all")
         pivot["utc_datetime"] = pd.to_datetime(pivot["utc_datetime"], utc=True)
-        pivot = pivot.sort_values("utc_datetime").reset_index(drop=True)
+        ens_cols = [c for c in pivot.columns if c.startswith("ens_")]
+        pivot = _as_member_block(pivot, ens_cols)
+        if len(ens_cols) == AVAILABLE_MODELS[model]["n_members"]:
+            # only a complete run is cached; one still loading is fetched again next time
+            _store_frame(cache_path, pivot)
+        pivot.attrs["issue"] = issue  # the resolved run, so callers needn't look it up again
 
         logger.info(
-            f"\u2713 Fetched {element} ensembles ({model}): {pivot.shape[0]} hours x {len([c for c in pivot.columns if c.startswith('ens_')])} members"
+            f"\u2713 Fetched {element} ensembles ({model}): {pivot.shape[0]} hours x {len(ens_cols)} members"
         )
         return pivot
 
@@ -245,8 +495,12 @@ class MetDeskDBClient:
         Returns DataFrame with columns like:
             [utc_datetime, wind_0%, wind_10%, ..., solar_0%, solar_10%, ..., total_ren_mean, ...]
         """
-        wind = self.get_percentile_forecasts(model, "wind", issue)
-        solar = self.get_percentile_forecasts(model, "solar", issue)
+        # Wind and solar are independent round-trips; run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            wind, solar = pool.map(
+                lambda element: self.get_percentile_forecasts(model, element, issue),
+                ("wind", "solar"),
+            )
 
         if wind.empty and solar.empty:
             return pd.DataFrame()
@@ -266,7 +520,7 @@ class MetDeskDBClient:
         if solar.empty:
             return wind
 
-        df = wind.merge(solar, on="utc_datetime", how="outer").fillna(0)
+        df = _side_by_side(wind, solar)
 
         # Add total renewables for key percentiles
         for pct in METDESK_PERCENTILE_MEMBERS + METDESK_SPECIAL_MEMBERS:
@@ -285,10 +539,19 @@ class MetDeskDBClient:
 
         Returns DataFrame with columns:
             [utc_datetime, wind_ens_01, ..., solar_ens_01, ..., total_ren_ens_01, ...]
+        and the resolved issue in attrs["issue"].
         """
         logger.info(f"Fetching renewable ensembles for {model}...")
-        wind = self.get_ensemble_forecasts(model, "wind", issue, location=location)
-        solar = self.get_ensemble_forecasts(model, "solar", issue, location=location)
+        issues = {"wind": issue, "solar": issue}
+        if issue is None:
+            # resolve the wind and solar latest issues together, one round-trip instead of two
+            latest = self.get_issues_bulk([(model, "wind"), (model, "solar")], n_latest=1, location=location)
+            issues = {element: found[0] if found else None for (_, element), found in latest.items()}
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            wind, solar = pool.map(
+                lambda element: self.get_ensemble_forecasts(model, element, issues[element], location=location),
+                ("wind", "solar"),
+            )
 
         if wind.empty and solar.empty:
             logger.error(f"No wind or solar ensemble data available for {model}")
@@ -314,24 +577,31 @@ class MetDeskDBClient:
         else:
             solar_renamed = pd.DataFrame()
 
+        resolved_issue = (wind if not wind.empty else solar).attrs.get("issue")
         if wind_renamed.empty:
             logger.info("Returning solar ensembles only")
+            solar_renamed.attrs["issue"] = resolved_issue
             return solar_renamed
         if solar_renamed.empty:
             logger.info("Returning wind ensembles only")
+            wind_renamed.attrs["issue"] = resolved_issue
             return wind_renamed
 
-        df = wind_renamed.merge(solar_renamed, on="utc_datetime", how="outer").fillna(0)
+        df = _side_by_side(wind_renamed, solar_renamed)
 
-        # Sum wind + solar per member
+        # Sum wind + solar per member, as one block addition over the members both have
         n_members = AVAILABLE_MODELS[model]["n_members"]
-        total_ren_cols = []
-        for i in range(1, n_members + 1):
-            w_col = f"wind_ens_{i:02d}"
-            s_col = f"solar_ens_{i:02d}"
-            if w_col in df.columns and s_col in df.columns:
-                df[f"total_ren_ens_{i:02d}"] = df[w_col] + df[s_col]
-                total_ren_cols.append(f"total_ren_ens_{i:02d}")
+        ids = [
+            f"{i:02d}" for i in range(1, n_members + 1)
+            if f"wind_ens_{i:02d}" in df.columns and f"solar_ens_{i:02d}" in df.columns
+        ]
+        total_ren_cols = [f"total_ren_ens_{i}" for i in ids]
+        total = (
+            df[[f"wind_ens_{i}" for i in ids]].to_numpy()
+            + df[[f"solar_ens_{i}" for i in ids]].to_numpy()
+        )
+        df = pd.concat([df, pd.DataFrame(total, index=df.index, columns=total_ren_cols)], axis=1)
+        df.attrs["issue"] = resolved_issue
 
         logger.info(f"\u2713 Renewable ensembles ready: {df.shape[0]} hours, {len(total_ren_cols)} members")
         return df
@@ -346,21 +616,45 @@ class MetDeskDBClient:
         """Get the N most recent issue times for a model."""
         if location is None:
             location = COUNTRY
-        query = text(f"""
-            SELECT DISTINCT issue
-            FROM {METDESK_TABLE}
-            WHERE location = :location
-              AND model = :model
-              AND element = :element
-            ORDER BY issue DESC
-            LIMIT :n
-        """)
         with self.engine.connect() as conn:
             result = conn.execute(
-                query,
+                AVAILABLE_ISSUES_SQL,
                 {"location": location, "model": model, "element": element, "n": n_latest},
             )
-            return [row[0] for row in result.fetchall()]
+            return result.scalars().all()
+
+    def get_issues_bulk(
+        self, pairs: List[Tuple[str, str]], n_latest: int = 10, location: Optional[str] = None
+    ) -> Dict[Tuple[str, str], List[datetime]]:
+        """
+        The N most recent issues for several (model, element) pairs in one round-trip.
+        The newest issue of each pair also primes the latest-issue cache.
+
+        Returns:
+            {(model, element): [issue, ...] newest first}; pairs without data map to [].
+        """
+        if location is None:
+            location = COUNTRY
+        pairs = list(dict.fromkeys(pairs))
+        params = {"location": location, "n": n_latest}
+        for i, (model, element) in enumerate(pairs):
+            params[f"m{i}"] = model
+            params[f"e{i}"] = element
+
+        issues: Dict[Tuple[str, str], List[datetime]] = {pair: [] for pair in pairs}
+        try:
+            with self.engine.connect() as conn:
+                for model, element, issue in conn.execute(_issues_bulk_sql(len(pairs)), params):
+                    issues[(model, element)].append(issue)
+        except Exception as e:
+            logger.error(f"Error getting issues for {pairs}: {e}")
+            return issues
+
+        now = time.monotonic()
+        for (model, element), found in issues.items():
+            if found:
+                _ISSUE_CACHE[(model, element, location)] = (now, found[0])
+        return issues
 
     def get_ensemble_by_issue_and_time(
         self,
@@ -381,53 +675,42 @@ class MetDeskDBClient:
         if location is None:
             location = COUNTRY
 
-        query = text(f"""
-            SELECT utc_datetime, member, value
-            FROM {METDESK_TABLE}
-            WHERE location = :location
-              AND model = :model
-              AND element = :element
-              AND issue = :issue
-              AND utc_datetime >= :valid_start
-              AND utc_datetime <= :valid_end
-            ORDER BY utc_datetime, member
-            LIMIT 50000
-        """)
-
         try:
-            with self.engine.connect() as conn:
-                df = pd.read_sql(
-                    query,
-                    conn,
-                    params={
-                        "location": location,
-                        "model": model,
-                        "element": element,
-                        "issue": issue,
-                        "valid_start": valid_start,
-                        "valid_end": valid_end,
-                    },
-                )
+            df = self._copy_query(
+                ENSEMBLE_BY_ISSUE_SQL,
+                {
+                    "location": location,
+                    "model": model,
+                    "element": element,
+                    "issue": issue,
+                    "valid_start": valid_start,
+                    "valid_end": valid_end,
+                },
+                # few distinct members: categorical keys make the pivot below cheaper
+                dtype={"member": "category", "value": np.float32},
+            )
 
             if df.empty:
                 logger.warning(f"No {element} data for {model} issue {issue}")
                 return pd.DataFrame()
 
+            df["utc_datetime"] = pd.to_datetime(df["utc_datetime"], utc=True)
+
             # Pivot to wide format (utc_datetime x members)
             pivot = df.pivot_table(
-                index="utc_datetime", columns="member", values="value", aggfunc="first"
+                index="utc_datetime", columns="member", values="value", aggfunc="first", observed=True
             )
-            pivot = pivot.reset_index()
 
             # Rename member columns to ens_00, ens_01, etc.
-            member_cols = [c for c in pivot.columns if c != "utc_datetime"]
-            for col in member_cols:
-                pivot.rename(columns={col: f"ens_{col}"}, inplace=True)
+            pivot.columns = [f"ens_{col}" for col in pivot.columns]
+            pivot = pivot.reset_index()
 
             # Add mean
             ens_cols = [c for c in pivot.columns if c.startswith("ens_")]
             if ens_cols:
-                pivot["ens_mean"] = pivot[ens_cols].mean(axis=1)
+                pivot = _as_member_block(pivot, ens_cols)
+                # One reduction over the member block (a view, no copy); NaN-skipping like DataFrame.mean
+                pivot["ens_mean"] = np.nanmean(pivot[ens_cols].to_numpy(), axis=1)
 
             logger.info(f"Fetched {element} for issue {issue}: {pivot.shape[0]} times")
             return pivot
@@ -436,6 +719,47 @@ class MetDeskDBClient:
             logger.error(f"Error fetching ensemble by issue/time: {e}")
             return pd.DataFrame()
 
+    def get_ensemble_means_by_issues(
+        self,
+        model: str,
+        elements: List[str],
+        issues: List[datetime],
+        valid_start: datetime,
+        valid_end: datetime,
+        location: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Ensemble mean for several elements and issues over a valid time range, in one query.
+        The mean over members is taken in the database, so only one row per
+        (element, issue, time) crosses the wire instead of every member.
+
+        Returns:
+            Long DataFrame with columns: [element, issue, utc_datetime, ens_mean]
+        """
+        if location is None:
+            location = COUNTRY
+
+        try:
+            with self.engine.connect() as conn:
+                df = pd.read_sql(
+                    ENSEMBLE_MEANS_BY_ISSUES_SQL,
+                    conn,
+                    params={
+                        "location": location,
+                        "model": model,
+                        "elements": list(elements),
+                        "issues": list(issues),
+                        "valid_start": valid_start,
+                        "valid_end": valid_end,
+                    },
+                )
+            logger.info(f"Fetched {elements} means for issues {issues}: {len(df)} rows")
+            return df
+
+        except Exception as e:
+            logger.error(f"Error fetching ensemble means by issues/time: {e}")
+            return pd.DataFrame(columns=["element", "issue", "utc_datetime", "ens_mean"])
+
     # =========================================================================
     # EQ CONSUMPTION DATA (from SQL database)
     # =========================================================================
@@ -453,27 +777,57 @@ class MetDeskDBClient:
         if location is None:
             location = 'fr'
 
-        query = text("""
-            SELECT utc_datetime, 
-                   COALESCE(consumption_fcst_latest, consumption_act) as consumption_mw
-            FROM silver.eq_consumption
-            WHERE LOWER(country) = :location
-              AND utc_datetime >= CURRENT_TIMESTAMP AT TIME ZONE 'UTC' - INTERVAL '2 days'
-            ORDER BY utc_datetime DESC
-            LIMIT 500
-        """)
-
         try:
             logger.info(f"Fetching EQ consumption data for {location}...")
             with self.engine.connect() as conn:
-                df = pd.read_sql(query, conn, params={"location": location})
+                df = pd.read_sql(
+                    EQ_CONSUMPTION_SQL,
+                    conn,
+                    params={"location": location, "cutoff": _recent_cutoff()},
+                    parse_dates={"utc_datetime": {"utc": True}},
+                )
             
             if df.empty:
                 logger.warning("No EQ consumption data found for FR.")
                 return pd.DataFrame(columns=["utc_datetime", "consumption_mw"])
 
-            df["utc_datetime"] = pd.to_datetime(df["utc_datetime"], utc=True)
-            df = df.sort_values("utc_datetime").reset_index(drop=True)
+            # rows arrive newest first (ORDER BY ... DESC LIMIT); reversing is enough
+            df = df.iloc[::-1].reset_index(drop=True)
+            logger.info(f"✓ Fetched EQ consumption: {len(df)} hourly points ({df['utc_datetime'].min()} to {df['utc_datetime'].max()})")
+            return df
+
+        except Exception as e:
+            logger.error(f"Error fetching EQ consumption: {e}")
+            import traceback
+            traceback.print_exc()
+            return pd.DataFrame(columns=["utc_datetime", "consumption_mw"])
+
+    def get_eq_consumption_multi(
+        self, locations: List[str], issue: Optional[datetime] = None, n_latest_days: int = 14
+    ) -> pd.DataFrame:
+        """
+        EQ consumption summed across several countries, aggregated in the database.
+        Same per-country selection as get_eq_consumption (latest 500 rows each).
+
+        Returns:
+            DataFrame with columns: [utc_datetime, consumption_mw]
+        """
+        locations = [loc.lower() for loc in locations]
+
+        try:
+            logger.info(f"Fetching EQ consumption data for {locations}...")
+            with self.engine.connect() as conn:
+                df = pd.read_sql(
+                    EQ_CONSUMPTION_MULTI_SQL,
+                    conn,
+                    params={"locations": locations, "cutoff": _recent_cutoff()},
+                    parse_dates={"utc_datetime": {"utc": True}},
+                )
+
+            if df.empty:
+                logger.warning(f"No EQ consumption data found for {locations}.")
+                return pd.DataFrame(columns=["utc_datetime", "consumption_mw"])
+
             logger.info(f"✓ Fetched EQ consumption: {len(df)} hourly points ({df['utc_datetime'].min()} to {df['utc_datetime'].max()})")
             return df
 
@@ -4,20 +4,13 @@ Quick debug to check the main issues
 import logging
 from datetime import datetime, timezone
 from sqlalchemy import text
-from config import DB_CONNECTION_STRING, METDESK_TABLE, COUNTRY
-from sqlalchemy import create_engine
+from config import get_engine, METDESK_TABLE, COUNTRY
 import pandas as pd
 
 logging.basicConfig(level=logging.WARNING)
 
 now_utc = datetime.now(timezone.utc)
-engine = create_engine(
-    DB_CONNECTION_STRING,
-    pool_size=3,
-    max_overflow=5,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
+engine = get_engine()
 
 print("\n" + "="*80)
 print("QUICK ISSUE CHECK")
@@ -42,16 +35,16 @@ with engine.connect() as conn:
 
 # Issue 2 & 3: Renewable data availability per model
 print("\n[2] & [3] RENEWABLE DATA BY MODEL")
+query = text(f"""
+    SELECT COUNT(*) as wind_count, COUNT(DISTINCT utc_datetime) as unique_hours,
+           MIN(utc_datetime) as min_date, MAX(utc_datetime) as max_date,
+           COUNT(DISTINCT issue) as num_issues
+    FROM {METDESK_TABLE}
+    WHERE location = :location
+      AND model = :model
+      AND element = 'wind'
+""")
 for model in ['eceps', 'ec46', 'gfsens', 'ecaifsens']:
-    query = text(f"""
-        SELECT COUNT(*) as wind_count, COUNT(DISTINCT utc_datetime) as unique_hours,
-               MIN(utc_datetime) as min_date, MAX(utc_datetime) as max_date,
-               COUNT(DISTINCT issue) as num_issues
-        FROM {METDESK_TABLE}
-        WHERE location = :location
-          AND model = :model
-          AND element = 'wind'
-    """)
     try:
         with engine.connect() as conn:
             result = conn.execute(query, {"location": COUNTRY, "model": model}).fetchone()
@@ -70,5 +63,4 @@ print("\n[4] CURRENT RESIDUAL PERCENTILES")
 print("  Currently computing: P10, P25, P50, P75, P90")
 print("  Need to add: P0-P100 (suggest P0, P5, P10, ... P95, P100)")
 
-engine.dispose()
 print("\n" + "="*80)
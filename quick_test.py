@@ -1,11 +1,11 @@
-from sqlalchemy import create_engine, text
-from config import DB_CONNECTION_STRING, COUNTRY
+from sqlalchemy import text
+from config import get_engine, COUNTRY
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-engine = create_engine(DB_CONNECTION_STRING)
+engine = get_engine()
 
 # Test 1: Quick check of MetDesk structure
 print("=" * 80)
@@ -24,7 +24,7 @@ with engine.connect() as conn:
     result = conn.execute(text("""
         SELECT DISTINCT location FROM silver.metdesk_forecasts LIMIT 20
     """))
-    locations = [row[0] for row in result]
+    locations = result.scalars().all()
     print(f"Available locations: {locations}")
     
     # If FR doesn't exist, find what does
@@ -33,8 +33,8 @@ with engine.connect() as conn:
         GROUP BY location LIMIT 10
     """))
     print("\nCounts by location:")
-    for row in result:
-        print(f"  {row[0]}: {row[1]:,} records")
+    for location, cnt in result:
+        print(f"  {location}: {cnt:,} records")
 
 # Test 2: EQ Consumption 
 print("\n" + "=" * 80)
@@ -58,5 +58,5 @@ with engine.connect() as conn:
         """))
         rows = result.fetchall()
         print(f"Sample consumption data (latest non-null):")
-        for row in rows:
-            print(f"  {row[0]}: {row[1]}")
+        for utc_datetime, latest in rows:
+            print(f"  {utc_datetime}: {latest}")
@@ -1,14 +1,22 @@
 """
 Scheduler for automatic reforecast updates.
+
+Updates run when the database signals new silver rows (LISTEN/NOTIFY),
+at the fixed reforecast times, and at a fallback polling interval.
 """
 import schedule
-import time
+import select
 import threading
+import time
 import logging
 from datetime import datetime
 from typing import Callable, Optional
 
-from config import REFORECAST_TIMES_UTC, REFRESH_INTERVAL_MINUTES
+from config import (
+    get_engine, REFORECAST_TIMES_UTC, REFRESH_INTERVAL_MINUTES,
+    UPDATE_NOTIFY_CHANNEL, UPDATE_NOTIFY_DEBOUNCE_S,
+)
+from metdesk_db import clear_issue_cache
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +26,9 @@ class ReforecastScheduler:
         self.update_callback = update_callback
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._listen_thread: Optional[threading.Thread] = None
+        self._update_lock = threading.Lock()
+        self._stop_event = threading.Event()
         self.last_run: Optional[datetime] = None
 
     def setup_schedule(self):
@@ -27,29 +38,83 @@ class ReforecastScheduler:
         schedule.every(REFRESH_INTERVAL_MINUTES).minutes.do(self._run_update)
 
     def _run_update(self):
-        try:
-            logger.info(f"Running scheduled update at {datetime.utcnow()}")
-            self.update_callback()
-            self.last_run = datetime.utcnow()
-        except Exception as e:
-            logger.error(f"Scheduled update failed: {e}", exc_info=True)
+        # Scheduled and NOTIFY-driven updates run on different threads; never overlap them
+        with self._update_lock:
+            try:
+                logger.info(f"Running scheduled update at {datetime.utcnow()}")
+                # A new run may have landed; resolve latest issues afresh
+                clear_issue_cache()
+                self.update_callback()
+                self.last_run = datetime.utcnow()
+            except Exception as e:
+                logger.error(f"Scheduled update failed: {e}", exc_info=True)
 
     def start(self):
         if self._running:
             return
+        # a restart right after stop() must not leave the previous threads running alongside
+        for thread in (self._thread, self._listen_thread):
+            if thread is not None:
+                thread.join()
         self.setup_schedule()
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
+        self._listen_thread = threading.Thread(target=self._listen_loop, daemon=True)
+        self._listen_thread.start()
         logger.info("Scheduler started.")
 
     def _loop(self):
         while self._running:
             schedule.run_pending()
-            time.sleep(30)
+            # Sleep exactly until the next job is due; stop() wakes us early
+            idle = schedule.idle_seconds()
+            self._stop_event.wait(max(idle, 0) if idle is not None else REFRESH_INTERVAL_MINUTES * 60)
+
+    def _listen_loop(self):
+        """Run an update whenever the ETL NOTIFYs the update channel; reconnect on failure."""
+        while self._running:
+            try:
+                self._listen()
+            except Exception as e:
+                logger.error(f"LISTEN on {UPDATE_NOTIFY_CHANNEL} failed: {e}; retrying in 60s")
+                self._stop_event.wait(60)
+
+    def _listen(self):
+        # Dedicated connection, detached from the pool so its LISTEN state never leaks back
+        raw = get_engine().raw_connection()
+        raw.detach()
+        conn = raw.driver_connection
+        try:
+            conn.rollback()
+            conn.autocommit = True
+            conn.cursor().execute(f"LISTEN {UPDATE_NOTIFY_CHANNEL}")
+            logger.info(f"Listening for updates on '{UPDATE_NOTIFY_CHANNEL}'")
+            # Debounce: the first notification opens a window, everything arriving before it
+            # closes (or while the update runs) is coalesced into the next single update
+            pending: set = set()
+            deadline: Optional[float] = None
+            while self._running:
+                timeout = 5 if deadline is None else min(max(deadline - time.monotonic(), 0), 5)
+                if select.select([conn], [], [], timeout) != ([], [], []):
+                    conn.poll()
+                    if conn.notifies:
+                        pending.update(n.payload for n in conn.notifies)
+                        conn.notifies.clear()
+                        if deadline is None:
+                            deadline = time.monotonic() + UPDATE_NOTIFY_DEBOUNCE_S
+                if deadline is not None and time.monotonic() >= deadline:
+                    logger.info(f"Update notification(s) received: {sorted(pending)}")
+                    pending.clear()
+                    deadline = None
+                    self._run_update()
+        finally:
+            raw.close()
 
     def stop(self):
         self._running = False
+        self._stop_event.set()
         schedule.clear()
         logger.info("Scheduler stopped.")
 
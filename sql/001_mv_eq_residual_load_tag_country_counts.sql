@@ -0,0 +1,20 @@
+-- Pre-aggregated tag/country row counts for silver.eq_residual_load.
+-- Serves the first diagnostic in check_eq_data.py without scanning the base table.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS silver.mv_eq_residual_load_tag_country_counts AS
+SELECT tag, country, COUNT(*) AS count
+FROM silver.eq_residual_load
+GROUP BY tag, country;
+
+-- Unique index is required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_eq_residual_load_tag_country_counts
+    ON silver.mv_eq_residual_load_tag_country_counts (tag, country);
+
+GRANT SELECT ON silver.mv_eq_residual_load_tag_country_counts TO analytics_viewer;
+
+-- Refresh after the silver load job (pg_cron, hourly at :15)
+SELECT cron.schedule(
+    'refresh_mv_eq_residual_load_tag_country_counts',
+    '15 * * * *',
+    $$REFRESH MATERIALIZED VIEW CONCURRENTLY silver.mv_eq_residual_load_tag_country_counts$$
+);
@@ -0,0 +1,4 @@
+-- Supports the loose index scan over distinct locations in check_locations.py.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_metdesk_forecasts_location
+    ON silver.metdesk_forecasts (location);
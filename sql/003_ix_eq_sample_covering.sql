@@ -0,0 +1,22 @@
+-- Covering indexes for the "latest rows" samples in check_eq_data.py.
+-- Each INCLUDE list matches the sample's projection, so the query is an index-only scan.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_eq_residual_load_utc_desc_cov
+    ON silver.eq_residual_load (utc_datetime DESC)
+    INCLUDE (residual_load, e00, e01, e02, tag, country);
+
+-- Partial on the FR predicate used by the samples
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_eq_consumption_fr_utc_desc_cov
+    ON silver.eq_consumption (utc_datetime DESC)
+    INCLUDE (consumption_act, da_consumption_fcst, consumption_fcst_latest, country)
+    WHERE country = 'FR';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_eq_wind_solar_fr_utc_desc_cov
+    ON silver.eq_wind_solar (utc_datetime DESC)
+    INCLUDE (production_acc, data_type, production_fcst_latest, country)
+    WHERE country = 'FR';
+
+-- Index-only scans need an up-to-date visibility map
+VACUUM (ANALYZE) silver.eq_residual_load;
+VACUUM (ANALYZE) silver.eq_consumption;
+VACUUM (ANALYZE) silver.eq_wind_solar;
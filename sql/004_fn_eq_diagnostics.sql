@@ -0,0 +1,38 @@
+-- All check_eq_data.py diagnostics in one call: a jsonb object with one array per diagnostic.
+-- Depends on sql/001_mv_eq_residual_load_tag_country_counts.sql.
+
+CREATE OR REPLACE FUNCTION silver.fn_eq_diagnostics()
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'tag_counts', (SELECT COALESCE(jsonb_agg(x), '[]') FROM (
+            SELECT tag, country, count
+            FROM silver.mv_eq_residual_load_tag_country_counts
+            ORDER BY tag, country
+        ) x),
+        'rl_sample', (SELECT COALESCE(jsonb_agg(x), '[]') FROM (
+            SELECT utc_datetime, residual_load, e00, e01, e02, tag, country
+            FROM silver.eq_residual_load
+            ORDER BY utc_datetime DESC
+            LIMIT 5
+        ) x),
+        'cons_sample', (SELECT COALESCE(jsonb_agg(x), '[]') FROM (
+            SELECT utc_datetime, consumption_act, da_consumption_fcst, consumption_fcst_latest, country
+            FROM silver.eq_consumption
+            WHERE country = 'FR'
+            ORDER BY utc_datetime DESC
+            LIMIT 5
+        ) x),
+        'ws_sample', (SELECT COALESCE(jsonb_agg(x), '[]') FROM (
+            SELECT utc_datetime, production_acc, data_type, production_fcst_latest, country
+            FROM silver.eq_wind_solar
+            WHERE country = 'FR'
+            ORDER BY utc_datetime DESC
+            LIMIT 10
+        ) x)
+    );
+$$;
+
+GRANT EXECUTE ON FUNCTION silver.fn_eq_diagnostics() TO analytics_viewer;
@@ -0,0 +1,22 @@
+-- Signal the dashboard scheduler (LISTEN silver_eq_updates) when new silver rows land.
+-- Statement-level, so a bulk load sends one notification per table, delivered at commit.
+
+CREATE OR REPLACE FUNCTION silver.fn_notify_silver_eq_updates()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_notify('silver_eq_updates', json_build_object('table', TG_TABLE_NAME)::text);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_notify_silver_eq_updates ON silver.eq_consumption;
+CREATE TRIGGER trg_notify_silver_eq_updates
+    AFTER INSERT OR UPDATE ON silver.eq_consumption
+    FOR EACH STATEMENT EXECUTE FUNCTION silver.fn_notify_silver_eq_updates();
+
+DROP TRIGGER IF EXISTS trg_notify_silver_eq_updates ON silver.metdesk_forecasts;
+CREATE TRIGGER trg_notify_silver_eq_updates
+    AFTER INSERT OR UPDATE ON silver.metdesk_forecasts
+    FOR EACH STATEMENT EXECUTE FUNCTION silver.fn_notify_silver_eq_updates();
@@ -0,0 +1,155 @@
+-- Rolling "latest rows" per (table, country) for check_eq_data.py, kept current by triggers.
+-- Statement-level triggers with transition tables: one upsert + one trim per load statement.
+-- variant is the column that splits a timestamp into several rows (tag in eq_residual_load,
+-- data_type in eq_wind_solar, '' for eq_consumption), passed as the trigger argument.
+-- Rows are ranked by (utc_datetime DESC, variant) so the trim and fn_eq_diagnostics agree on ties.
+
+-- Derived cache: recreate rather than alter, the backfill below repopulates it
+DROP TABLE IF EXISTS silver.eq_last_samples;
+CREATE UNLOGGED TABLE silver.eq_last_samples (
+    table_name   text        NOT NULL,
+    country      text        NOT NULL,
+    variant      text        NOT NULL,
+    utc_datetime timestamptz NOT NULL,
+    payload      jsonb       NOT NULL,
+    PRIMARY KEY (table_name, country, variant, utc_datetime)
+);
+
+GRANT SELECT ON silver.eq_last_samples TO analytics_viewer;
+
+CREATE OR REPLACE FUNCTION silver.fn_upsert_last_samples()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    WITH changed AS (
+        SELECT COALESCE(n.country, '') AS country,
+               COALESCE(to_jsonb(n) ->> TG_ARGV[0], '') AS variant,
+               n.utc_datetime, to_jsonb(n) AS payload
+        FROM new_rows n
+    ), latest AS (
+        SELECT DISTINCT ON (country, variant, utc_datetime) *
+        FROM changed
+        ORDER BY country, variant, utc_datetime
+    ), ranked AS (
+        SELECT *, row_number() OVER (PARTITION BY country ORDER BY utc_datetime DESC, variant) AS rn
+        FROM latest
+    )
+    INSERT INTO silver.eq_last_samples (table_name, country, variant, utc_datetime, payload)
+    SELECT TG_TABLE_NAME, country, variant, utc_datetime, payload
+    FROM ranked
+    WHERE rn <= 10
+    ON CONFLICT (table_name, country, variant, utc_datetime) DO UPDATE SET payload = EXCLUDED.payload;
+
+    -- Keep only the 10 newest rows per country for this table
+    DELETE FROM silver.eq_last_samples s
+    USING (
+        SELECT country, variant, utc_datetime,
+               row_number() OVER (PARTITION BY country ORDER BY utc_datetime DESC, variant) AS rn
+        FROM silver.eq_last_samples
+        WHERE table_name = TG_TABLE_NAME
+    ) old
+    WHERE s.table_name = TG_TABLE_NAME
+      AND s.country = old.country
+      AND s.variant = old.variant
+      AND s.utc_datetime = old.utc_datetime
+      AND old.rn > 10;
+
+    RETURN NULL;
+END;
+$$;
+
+-- Transition tables allow one event per trigger, so INSERT and UPDATE each get their own
+DROP TRIGGER IF EXISTS trg_eq_last_samples ON silver.eq_residual_load;
+CREATE TRIGGER trg_eq_last_samples
+    AFTER INSERT ON silver.eq_residual_load
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION silver.fn_upsert_last_samples('tag');
+
+DROP TRIGGER IF EXISTS trg_eq_last_samples_upd ON silver.eq_residual_load;
+CREATE TRIGGER trg_eq_last_samples_upd
+    AFTER UPDATE ON silver.eq_residual_load
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION silver.fn_upsert_last_samples('tag');
+
+DROP TRIGGER IF EXISTS trg_eq_last_samples ON silver.eq_consumption;
+CREATE TRIGGER trg_eq_last_samples
+    AFTER INSERT ON silver.eq_consumption
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION silver.fn_upsert_last_samples();
+
+DROP TRIGGER IF EXISTS trg_eq_last_samples_upd ON silver.eq_consumption;
+CREATE TRIGGER trg_eq_last_samples_upd
+    AFTER UPDATE ON silver.eq_consumption
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION silver.fn_upsert_last_samples();
+
+DROP TRIGGER IF EXISTS trg_eq_last_samples ON silver.eq_wind_solar;
+CREATE TRIGGER trg_eq_last_samples
+    AFTER INSERT ON silver.eq_wind_solar
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION silver.fn_upsert_last_samples('data_type');
+
+DROP TRIGGER IF EXISTS trg_eq_last_samples_upd ON silver.eq_wind_solar;
+CREATE TRIGGER trg_eq_last_samples_upd
+    AFTER UPDATE ON silver.eq_wind_solar
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION silver.fn_upsert_last_samples('data_type');
+
+-- Backfill from the current contents (unlogged: re-run after a crash/failover empties it)
+INSERT INTO silver.eq_last_samples (table_name, country, variant, utc_datetime, payload)
+SELECT table_name, country, variant, utc_datetime, payload
+FROM (
+    SELECT 'eq_residual_load' AS table_name, COALESCE(country, '') AS country,
+           COALESCE(tag::text, '') AS variant, utc_datetime, to_jsonb(t) AS payload,
+           row_number() OVER (
+               PARTITION BY COALESCE(country, '') ORDER BY utc_datetime DESC, COALESCE(tag::text, '')
+           ) AS rn
+    FROM silver.eq_residual_load t
+    UNION ALL
+    SELECT 'eq_consumption', COALESCE(country, ''), '', utc_datetime, to_jsonb(t),
+           row_number() OVER (PARTITION BY COALESCE(country, '') ORDER BY utc_datetime DESC)
+    FROM silver.eq_consumption t
+    UNION ALL
+    SELECT 'eq_wind_solar', COALESCE(country, ''), COALESCE(data_type::text, ''), utc_datetime, to_jsonb(t),
+           row_number() OVER (
+               PARTITION BY COALESCE(country, '') ORDER BY utc_datetime DESC, COALESCE(data_type::text, '')
+           )
+    FROM silver.eq_wind_solar t
+) s
+WHERE rn <= 10
+ON CONFLICT (table_name, country, variant, utc_datetime) DO NOTHING;
+
+-- Diagnostics now read the samples from the rolling table (replaces sql/004's definition).
+-- Same row sets as the sql/004 queries; ties on utc_datetime are broken by country/variant.
+CREATE OR REPLACE FUNCTION silver.fn_eq_diagnostics()
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'tag_counts', (SELECT COALESCE(jsonb_agg(x), '[]') FROM (
+            SELECT tag, country, count
+            FROM silver.mv_eq_residual_load_tag_country_counts
+            ORDER BY tag, country
+        ) x),
+        'rl_sample', (SELECT COALESCE(jsonb_agg(payload ORDER BY utc_datetime DESC, country, variant), '[]') FROM (
+            SELECT payload, utc_datetime, country, variant FROM silver.eq_last_samples
+            WHERE table_name = 'eq_residual_load'
+            ORDER BY utc_datetime DESC, country, variant
+            LIMIT 5
+        ) x),
+        'cons_sample', (SELECT COALESCE(jsonb_agg(payload ORDER BY utc_datetime DESC), '[]') FROM (
+            SELECT payload, utc_datetime FROM silver.eq_last_samples
+            WHERE table_name = 'eq_consumption' AND country = 'FR'
+            ORDER BY utc_datetime DESC
+            LIMIT 5
+        ) x),
+        'ws_sample', (SELECT COALESCE(jsonb_agg(payload ORDER BY utc_datetime DESC, variant), '[]') FROM (
+            SELECT payload, utc_datetime, variant FROM silver.eq_last_samples
+            WHERE table_name = 'eq_wind_solar' AND country = 'FR'
+            ORDER BY utc_datetime DESC, variant
+            LIMIT 10
+        ) x)
+    );
+$$;
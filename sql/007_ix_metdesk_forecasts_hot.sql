@@ -0,0 +1,16 @@
+-- Covering indexes for the MetDesk and consumption reads in metdesk_db.py.
+-- Every forecast read filters on (location, model, element, issue[, utc_datetime]), and
+-- MAX(issue) for _get_latest_issue becomes a one-row backward scan on the same prefix.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_metdesk_forecasts_hot
+    ON silver.metdesk_forecasts (location, model, element, issue, utc_datetime)
+    INCLUDE (member, value);
+
+-- get_eq_consumption / get_eq_consumption_multi: LOWER(country) filter, latest rows first
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_eq_consumption_country_utc_desc_cov
+    ON silver.eq_consumption (LOWER(country), utc_datetime DESC)
+    INCLUDE (consumption_fcst_latest, consumption_act);
+
+-- Index-only scans need an up-to-date visibility map
+VACUUM (ANALYZE) silver.metdesk_forecasts;
+VACUUM (ANALYZE) silver.eq_consumption;
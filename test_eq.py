@@ -1,7 +1,7 @@
-from sqlalchemy import create_engine, text
-from config import DB_CONNECTION_STRING
+from sqlalchemy import text
+from config import get_engine
 
-engine = create_engine(DB_CONNECTION_STRING)
+engine = get_engine()
 
 with engine.connect() as conn:
     # Check if FR data exists
@@ -16,5 +16,5 @@ with engine.connect() as conn:
         WHERE country='FR' 
         LIMIT 5
     """))
-    for row in r:
-        print(f"  {row[0]}: {row[1]}")
+    for utc_datetime, latest in r:
+        print(f"  {utc_datetime}: {latest}")
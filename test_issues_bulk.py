@@ -0,0 +1,86 @@
+"""
+Offline check of get_issues_bulk: the statement and binds built for two pairs, and how the
+returned rows are grouped per (model, element). No database needed.
+
+Run with: python -m pytest test_issues_bulk.py  (or python test_issues_bulk.py)
+"""
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import metdesk_db
+from metdesk_db import MetDeskDBClient, _ISSUE_CACHE, _issues_bulk_sql
+
+
+def _issue(day, hour):
+    return datetime(2026, 1, day, hour, tzinfo=timezone.utc)
+
+
+class _FakeEngine:
+    """Records the executed statement and binds, returns canned rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    @contextmanager
+    def connect(self):
+        yield self
+
+    def execute(self, statement, params):
+        self.calls.append((str(statement), params))
+        return iter(self.rows)
+
+
+def test_sql_for_two_pairs():
+    sql = str(_issues_bulk_sql(2))
+    assert "(VALUES (:m0, :e0), (:m1, :e1)) AS p(model, element)" in sql
+    assert "CROSS JOIN LATERAL" in sql
+    assert ":m2" not in sql
+    # one index probe per pair, capped at N issues
+    assert "AND model = p.model" in sql and "AND element = p.element" in sql
+    assert "LIMIT :n" in sql
+    assert _issues_bulk_sql(2) is _issues_bulk_sql(2)
+
+
+def test_binds_and_grouping():
+    rows = [
+        ("eceps", "solar", _issue(2, 0)),
+        ("eceps", "wind", _issue(2, 12)),
+        ("eceps", "wind", _issue(2, 0)),
+    ]
+    fake = _FakeEngine(rows)
+    original, metdesk_db.get_engine = metdesk_db.get_engine, lambda: fake
+    _ISSUE_CACHE.clear()
+    try:
+        # the repeated pair is dropped, leaving two
+        issues = MetDeskDBClient().get_issues_bulk(
+            [("eceps", "wind"), ("eceps", "solar"), ("eceps", "wind")],
+            n_latest=2,
+            location="FR",
+        )
+    finally:
+        metdesk_db.get_engine = original
+
+    (sql, params), = fake.calls
+    assert sql == str(_issues_bulk_sql(2))
+    assert params == {
+        "location": "FR", "n": 2,
+        "m0": "eceps", "e0": "wind",
+        "m1": "eceps", "e1": "solar",
+    }
+    assert issues == {
+        ("eceps", "wind"): [_issue(2, 12), _issue(2, 0)],
+        ("eceps", "solar"): [_issue(2, 0)],
+    }
+    # the newest issue of each pair with data primes the latest-issue cache
+    assert {key: hit[1] for key, hit in _ISSUE_CACHE.items()} == {
+        ("eceps", "wind", "FR"): _issue(2, 12),
+        ("eceps", "solar", "FR"): _issue(2, 0),
+    }
+    _ISSUE_CACHE.clear()
+
+
+if __name__ == "__main__":
+    test_sql_for_two_pairs()
+    test_binds_and_grouping()
+    print("✓ get_issues_bulk OK")
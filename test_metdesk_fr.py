@@ -1,25 +1,25 @@
-from sqlalchemy import create_engine, text
-from config import DB_CONNECTION_STRING, COUNTRY
+from sqlalchemy import text
+from config import get_engine, COUNTRY
 
-engine = create_engine(DB_CONNECTION_STRING)
+engine = get_engine()
 
 try:
     with engine.connect() as conn:
         # Check if FR data exists
         print(f"Checking for {COUNTRY} data in metdesk_forecasts...")
-        result = conn.execute(text(f"""
+        result = conn.execute(text("""
             SELECT location, model, element, COUNT(*) as cnt
             FROM silver.metdesk_forecasts
-            WHERE location = '{COUNTRY}'
+            WHERE location = :loc
             GROUP BY location, model, element
             LIMIT 20
-        """))
+        """), {"loc": COUNTRY})
         
         rows = result.fetchall()
         if rows:
             print(f"Found {len(rows)} different location/model/element combinations:")
-            for row in rows:
-                print(f"  {row[0]}/{row[1]}/{row[2]}: {row[3]} records")
+            for location, model, element, cnt in rows:
+                print(f"  {location}/{model}/{element}: {cnt} records")
         else:
             print(f"No data found for location='{COUNTRY}'")
             # Check what locations DO exist
@@ -29,8 +29,8 @@ try:
                 FROM silver.metdesk_forecasts
                 LIMIT 10
             """))
-            for row in result:
-                print(f"  {row[0]}")
+            for location in result.scalars():
+                print(f"  {location}")
                 
 except Exception as e:
     print(f"Error: {e}")
@@ -27,7 +27,12 @@ print("\n" + "=" * 80)
 print("Testing Merge")
 print("=" * 80)
 if not consumption.empty and not ren_ens.empty:
-    merged = consumption.merge(ren_ens, on="utc_datetime", how="inner")
+    # Join on plain int64 nanosecond keys (same unit on both sides) rather than tz-aware datetimes
+    cons_keyed = consumption.assign(_ts=consumption["utc_datetime"].dt.as_unit("ns").astype("int64"))
+    ren_keyed = ren_ens.drop(columns="utc_datetime").assign(
+        _ts=ren_ens["utc_datetime"].dt.as_unit("ns").astype("int64")
+    )
+    merged = cons_keyed.merge(ren_keyed, on="_ts", how="inner").drop(columns="_ts")
     print(f"Merged shape: {merged.shape}")
     if merged.empty:
         print("ERROR: No overlapping data!")
@@ -0,0 +1,43 @@
+"""
+Offline check that _side_by_side zero-fills gaps whether or not wind and solar hours match.
+
+Run with: python -m pytest test_side_by_side.py  (or python test_side_by_side.py)
+"""
+import numpy as np
+import pandas as pd
+
+from metdesk_db import _side_by_side
+
+
+def _frame(hours, col, values):
+    return pd.DataFrame({
+        "utc_datetime": pd.date_range("2026-01-01", periods=hours, freq="h", tz="UTC"),
+        col: np.asarray(values, dtype=np.float32),
+    })
+
+
+def test_aligned_hours_fill_missing_values():
+    wind = _frame(3, "wind_ens_00", [1.0, np.nan, 3.0])
+    solar = _frame(3, "solar_ens_00", [0.0, 5.0, np.nan])
+    out = _side_by_side(wind, solar)
+    assert list(out.columns) == ["utc_datetime", "wind_ens_00", "solar_ens_00"]
+    assert not out.isna().any().any()
+    assert out["wind_ens_00"].tolist() == [1.0, 0.0, 3.0]
+    assert out["solar_ens_00"].tolist() == [0.0, 5.0, 0.0]
+
+
+def test_misaligned_hours_fill_gaps():
+    wind = _frame(3, "wind_ens_00", [1.0, 2.0, 3.0])
+    solar = _frame(2, "solar_ens_00", [4.0, 5.0]).iloc[::-1]  # shorter and out of order
+    out = _side_by_side(wind, solar)
+    assert out["utc_datetime"].is_monotonic_increasing
+    assert len(out) == 3
+    assert not out.isna().any().any()
+    assert out["wind_ens_00"].tolist() == [1.0, 2.0, 3.0]
+    assert out["solar_ens_00"].tolist() == [4.0, 5.0, 0.0]
+
+
+if __name__ == "__main__":
+    test_aligned_hours_fill_missing_values()
+    test_misaligned_hours_fill_gaps()
+    print("✓ _side_by_side OK")
@@ -5,12 +5,21 @@ Fetches:
 - Deterministic demand forecast
 - Ensemble demand forecast (for probabilistic scenarios)
 """
+import functools
+import json
+import os
+import tempfile
+import time
+import warnings
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from config import (
     VOLUE_CLIENT_ID,
@@ -23,6 +32,58 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# orjson parses the large ensemble payloads several times faster; stdlib json if not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# OAuth token persisted between processes, so a fresh client skips the token round-trip
+TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "volue_token.json")
+# Curve name -> id per API base URL; curve ids don't change, so entries never expire
+CURVE_ID_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "volue_curve_ids.json")
+
+
+# demand_ensemble (ec00ens) carries 51 members: control + 50 perturbed
+ENS_COLS = tuple(f"ens_{i:02d}" for i in range(1, 52))
+
+
+@functools.lru_cache(maxsize=4)
+def _ens_columns(n_members: int) -> tuple:
+    """ens_01 .. ens_NN for a member count: ENS_COLS itself (or a prefix of it) up to 51 members."""
+    if n_members <= len(ENS_COLS):
+        return ENS_COLS[:n_members]
+    return ENS_COLS + tuple(f"ens_{i:02d}" for i in range(len(ENS_COLS) + 1, n_members + 1))
+
+
+def _iso_utc(dt: datetime) -> str:
+    """dt as an ISO8601 UTC string with a Z suffix; naive datetimes are taken as UTC."""
+    dt = dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+    return dt.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _read_json(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json_atomic(path: str, payload: dict, mode: int = 0o644):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # mkstemp gives every writer (thread or process) its own file, created 0o600
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
 
 class VolueInsightClient:
     """Client for Volue Insight / Wattsight API."""
@@ -30,15 +91,54 @@ class VolueInsightClient:
     def __init__(self):
         self.base_url = VOLUE_BASE_URL
         self.token = None
-        self.token_expiry = None
+        self.token_expiry = None  # wall-clock UTC, for the on-disk cache
+        self._token_deadline = 0.0  # time.monotonic() after which the token is refreshed
+        # One keep-alive session, so calls after the first skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        # Ask for compressed JSON; urllib3 lists br/zstd only when it can decode them
+        self.session.headers.update(make_headers(accept_encoding=True))
+        self.session.headers["Accept"] = "application/json"
+        self._curve_id_cache: dict = _read_json(CURVE_ID_CACHE_PATH).get(self.base_url, {})
+        self._load_cached_token()
+
+    def _load_cached_token(self):
+        """Reuse a still-valid token written by an earlier process for the same client id."""
+        try:
+            cached = _read_json(TOKEN_CACHE_PATH)
+            if cached.get("client_id") != VOLUE_CLIENT_ID:
+                return
+            expiry = datetime.fromisoformat(cached["expiry"])
+            remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+            if remaining > 0:
+                self.token, self.token_expiry = cached["access_token"], expiry
+                self._token_deadline = time.monotonic() + remaining
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    def _store_cached_token(self):
+        """Write the token atomically, readable by the current user only."""
+        try:
+            _write_json_atomic(
+                TOKEN_CACHE_PATH,
+                {
+                    "client_id": VOLUE_CLIENT_ID,
+                    "access_token": self.token,
+                    "expiry": self.token_expiry.isoformat(),
+                },
+                mode=0o600,
+            )
+        except OSError as e:
+            logger.warning(f"Could not cache Volue token: {e}")
 
     def _authenticate(self):
         """Get OAuth2 token from Volue Insight."""
-        if self.token and self.token_expiry and datetime.utcnow() < self.token_expiry:
+        # monotonic, so a wall-clock jump can't keep a stale token alive or drop a good one
+        if self.token and time.monotonic() < self._token_deadline:
             return
 
         logger.info("Authenticating with Volue Insight...")
-        response = requests.post(
+        response = self.session.post(
             VOLUE_TOKEN_URL,
             data={
                 "grant_type": "client_credentials",
@@ -47,11 +147,12 @@ class VolueInsightClient:
             },
         )
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         self.token = data["access_token"]
-        self.token_expiry = datetime.utcnow() + timedelta(
-            seconds=data.get("expires_in", 3600) - 60
-        )
+        lifetime = data.get("expires_in", 3600) - 60
+        self._token_deadline = time.monotonic() + lifetime
+        self.token_expiry = datetime.now(timezone.utc) + timedelta(seconds=lifetime)
+        self._store_cached_token()
         logger.info("Authenticated successfully.")
 
     def _headers(self):
@@ -59,22 +160,50 @@ class VolueInsightClient:
         return {"Authorization": f"Bearer {self.token}"}
 
     def _get_curve_id(self, curve_name: str) -> int:
-        """Search for a curve by name and return its ID."""
-        response = requests.get(
+        """Search for a curve by name and return its ID (memoized, also on disk)."""
+        if curve_name in self._curve_id_cache:
+            return self._curve_id_cache[curve_name]
+        curve_id = self._search_curve_id(curve_name)
+        self._curve_id_cache[curve_name] = curve_id
+        try:
+            cached = _read_json(CURVE_ID_CACHE_PATH)
+            cached[self.base_url] = self._curve_id_cache
+            _write_json_atomic(CURVE_ID_CACHE_PATH, cached)
+        except OSError as e:
+            logger.warning(f"Could not cache Volue curve ids: {e}")
+        return curve_id
+
+    def _search_curve_id(self, curve_name: str) -> int:
+        """Look a curve up by name via /curves, preferring an exact match."""
+        response = self.session.get(
             f"{self.base_url}/curves",
             headers=self._headers(),
             params={"query": curve_name},
         )
         response.raise_for_status()
-        curves = response.json()
+        curves = _json_loads(response.content)
         if not curves:
             raise ValueError(f"No curve found matching: {curve_name}")
-        for curve in curves:
-            if curve["name"].lower() == curve_name.lower():
-                return curve["id"]
+        # reversed, so the first of any same-named curves wins, as with a forward scan
+        by_name = {curve["name"].lower(): curve["id"] for curve in reversed(curves)}
+        curve_id = by_name.get(curve_name.lower())
+        if curve_id is not None:
+            return curve_id
         logger.warning(f"No exact match for '{curve_name}', using: {curves[0]['name']}")
         return curves[0]["id"]
 
+    @staticmethod
+    def _window_params(issue_date: Optional[datetime] = None) -> dict:
+        """from/to (now .. now + horizon) and optional issue_date query params, from one clock read."""
+        now = datetime.now(timezone.utc)
+        params = {
+            "from": _iso_utc(now),
+            "to": _iso_utc(now + timedelta(days=FORECAST_HORIZON_DAYS)),
+        }
+        if issue_date:
+            params["issue_date"] = _iso_utc(issue_date)
+        return params
+
     def get_demand_forecast(self, issue_date: Optional[datetime] = None) -> pd.DataFrame:
         """
         Fetch the latest deterministic demand forecast for France.
@@ -85,23 +214,15 @@ class VolueInsightClient:
         curve_name = VOLUE_CURVES["demand_forecast"]
         curve_id = self._get_curve_id(curve_name)
 
-        now = datetime.utcnow()
-        end = now + timedelta(days=FORECAST_HORIZON_DAYS)
-
-        params = {
-            "from": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "to": end.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        }
-        if issue_date:
-            params["issue_date"] = issue_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        params = self._window_params(issue_date)
 
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/instances/{curve_id}/latest",
             headers=self._headers(),
             params=params,
         )
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
 
         df = pd.DataFrame(data.get("points", data))
         if df.empty:
@@ -117,33 +238,39 @@ class VolueInsightClient:
         Fetch ensemble demand forecast for France.
 
         Returns:
-            DataFrame with columns: [utc_datetime, ens_01, ens_02, ..., ens_51]
+            DataFrame with columns: [utc_datetime, ens_01, ens_02, ..., ens_51] (see ENS_COLS)
         """
         curve_name = VOLUE_CURVES["demand_ensemble"]
         curve_id = self._get_curve_id(curve_name)
 
-        now = datetime.utcnow()
-        end = now + timedelta(days=FORECAST_HORIZON_DAYS)
-
-        params = {
-            "from": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "to": end.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        }
-        if issue_date:
-            params["issue_date"] = issue_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        params = self._window_params(issue_date)
 
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/instances/{curve_id}/latest",
             headers=self._headers(),
             params=params,
         )
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
 
         df = self._parse_ensemble_response(data)
         logger.info(f"Fetched demand ensembles: {df.shape}")
         return df
 
+    def fetch_all(self, issue_date: Optional[datetime] = None):
+        """
+        Deterministic and ensemble demand forecasts, fetched concurrently.
+
+        Returns:
+            (demand_forecast, demand_ensembles) as from the two getters
+        """
+        # Resolve the token once up front so the two threads don't both authenticate
+        self._authenticate()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            forecast = pool.submit(self.get_demand_forecast, issue_date)
+            ensembles = pool.submit(self.get_demand_ensembles, issue_date)
+            return forecast.result(), ensembles.result()
+
     def get_demand_percentiles(
         self, percentiles: list = [10, 25, 50, 75, 90], issue_date: Optional[datetime] = None
     ) -> pd.DataFrame:
@@ -152,16 +279,29 @@ class VolueInsightClient:
         if ensembles.empty:
             return pd.DataFrame()
 
-        ens_cols = [c for c in ensembles.columns if c.startswith("ens_")]
+        # _parse_ensemble_response lays the frame out as utc_datetime then ens_01..ens_NN
+        ens_cols = list(_ens_columns(ensembles.shape[1] - 1))
         result = pd.DataFrame({"utc_datetime": ensembles["utc_datetime"]})
 
-        for p in percentiles:
-            result[f"demand_{p}%"] = np.percentile(
-                ensembles[ens_cols].values, p, axis=1
-            )
+        # The members are one block (see _parse_ensemble_response), so to_numpy(copy=False) is a
+        # read-only column-major view of it, and its transpose is an (N, T) C-contiguous view.
+        # Copying that is a straight memcpy into a private array np.quantile may sort in place.
+        arr = ensembles[ens_cols].to_numpy(dtype=np.float32, copy=False).T.copy()
+        # the median is the 50th percentile, so it comes out of the same call
+        levels = list(percentiles) if 50 in percentiles else [*percentiles, 50]
+        # NaN-aware so a missing member (or the NaN padding) doesn't blank the hour; the mean
+        # accumulates in float64 and the levels stay float64 so the interpolation points are exact
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # hours with no members stay NaN
+            mean = np.nanmean(arr, axis=0, dtype=np.float64).astype(np.float32)
+            qs = np.nanquantile(
+                arr, np.asarray(levels, dtype=np.float64) / 100, axis=0, method="linear", overwrite_input=True
+            ).astype(np.float32)
+        for i, p in enumerate(percentiles):
+            result[f"demand_{p}%"] = qs[i]
         # Add mean and median
-        result["demand_mean"] = ensembles[ens_cols].mean(axis=1)
-        result["demand_median"] = ensembles[ens_cols].median(axis=1)
+        result["demand_mean"] = mean
+        result["demand_median"] = qs[levels.index(50)]
 
         return result
 
@@ -171,24 +311,29 @@ class VolueInsightClient:
             df = df.rename(columns={"t": "utc_datetime", "v": value_col})
         elif "time" in df.columns:
             df = df.rename(columns={"time": "utc_datetime", "value": value_col})
-        df["utc_datetime"] = pd.to_datetime(df["utc_datetime"], utc=True)
-        df = df.sort_values("utc_datetime").reset_index(drop=True)
+        # The API returns ISO8601 strings; saying so skips per-string format inference
+        df["utc_datetime"] = pd.to_datetime(df["utc_datetime"], utc=True, format="ISO8601")
+        if not df["utc_datetime"].is_monotonic_increasing:
+            df = df.sort_values("utc_datetime").reset_index(drop=True)
         return df[["utc_datetime", value_col]]
 
     def _parse_ensemble_response(self, data: dict) -> pd.DataFrame:
         """Parse ensemble API response into wide-format DataFrame."""
-        records = []
         points = data if isinstance(data, list) else data.get("points", [])
+        if not points:
+            return pd.DataFrame()
 
-        for point in points:
-            row = {"utc_datetime": point.get("t") or point.get("time")}
-            scenarios = point.get("scenarios") or point.get("values", [])
-            for i, val in enumerate(scenarios):
-                row[f"ens_{i+1:02d}"] = val
-            records.append(row)
+        # Fill one (T, N) array directly rather than building a dict per timestamp
+        times = [point.get("t") or point.get("time") for point in points]
+        scenarios = [point.get("scenarios") or point.get("values", []) for point in points]
+        n_members = max(len(row) for row in scenarios)
+        # float32: MW demand needs nowhere near float64 precision, and it halves the block
+        values = np.full((len(points), n_members), np.nan, dtype=np.float32)
+        for i, row in enumerate(scenarios):
+            values[i, : len(row)] = row
 
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["utc_datetime"] = pd.to_datetime(df["utc_datetime"], utc=True)
+        df = pd.DataFrame(values, columns=_ens_columns(n_members))
+        df.insert(0, "utc_datetime", pd.to_datetime(times, utc=True, format="ISO8601"))
+        if not df["utc_datetime"].is_monotonic_increasing:
             df = df.sort_values("utc_datetime").reset_index(drop=True)
         return df